@@ -12,19 +12,25 @@ It does NOT contain any business logic.
 
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import logging
+import os
 import time as time_module
 from datetime import datetime, time, date
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import (
     async_track_state_change_event,
     async_track_time_change,
 )
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
+from homeassistant.util.file import write_utf8_file, write_utf8_file_atomic
+from homeassistant.util.json import SerializationError
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -80,6 +86,14 @@ from .domain.forecaster import ConsumptionForecaster
 from .domain.savings_calculator import SavingsCalculator
 from .infra.notifier import Notifier
 
+# Baseline for EV update notifications (read-only, shared)
+_EMPTY_CHARGE_PLAN = ChargePlan()
+
+# Set while a plan recalculation runs, seen by the event handlers it calls
+_RECALC_RUNNING: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "nidia_recalc_running", default=False
+)
+
 
 class NidiaStore(Store):
     """Custom storage with migration support."""
@@ -116,6 +130,24 @@ class NidiaStore(Store):
         # If version is already current or unknown, return as-is
         return old_data
 
+    def _write_data(self, path: str, data: dict) -> None:
+        """Write the data as compact orjson bytes.
+
+        The default Store writer pretty-prints with indent=2, which roughly
+        doubles the size of the history/savings payload for no benefit.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        try:
+            json_data = json_bytes(data)
+        except TypeError as err:
+            raise SerializationError(
+                f"Failed to serialize to JSON: {path}: {err}"
+            ) from err
+
+        write = write_utf8_file_atomic if self._atomic_writes else write_utf8_file
+        write(path, json_data, self._private, mode="wb")
+
 
 class NidiaCoordinator:
     """Thin orchestrator for Nidia Smart Battery Recharge.
@@ -135,6 +167,11 @@ class NidiaCoordinator:
         self._listeners = []
         self._logger = get_logger()
 
+        # Single-flight plan recalculation (see recalculate_plan)
+        self._recalc_done: asyncio.Future | None = None
+        self._recalc_dirty = False
+        self._recalc_for_preview = True
+
         self._logger.info("COORDINATOR_INIT_START", version="2.3.0")
 
         # Initialize state from config
@@ -298,7 +335,7 @@ class NidiaCoordinator:
         await self._load_data()
 
         # Sync hardware state
-        self.hardware.sync_bypass_state()
+        self.hardware.sync_hardware_state()
 
         # Set up scheduled events
         self._setup_scheduled_events()
@@ -317,9 +354,14 @@ class NidiaCoordinator:
         if data:
             # Load consumption history
             if "history" in data:
-                self.forecaster = ConsumptionForecaster.from_dict(data)
+                # Rebuilding the history can take a while, keep it off the loop
+                self.forecaster = await self.hass.async_add_executor_job(
+                    ConsumptionForecaster.from_dict, data
+                )
                 # Keep state in sync for sensors that read from NidiaState.
-                self.state.consumption.history = list(self.forecaster.history)
+                self.state.consumption.set_history(
+                    self.forecaster.history, self.forecaster.weekday_averages
+                )
                 self._logger.info(
                     "HISTORY_LOADED",
                     records=self.forecaster.history_count
@@ -327,7 +369,9 @@ class NidiaCoordinator:
 
             # Load savings data
             if "savings" in data:
-                self.savings = SavingsCalculator.from_dict(data["savings"])
+                self.savings = await self.hass.async_add_executor_job(
+                    SavingsCalculator.from_dict, data["savings"]
+                )
                 self._logger.info(
                     "SAVINGS_LOADED",
                     lifetime_savings=self.savings.state.lifetime_savings_eur
@@ -337,10 +381,7 @@ class NidiaCoordinator:
                 self._sync_pricing()
 
                 # Update state with loaded savings
-                self.state.savings.total_savings_eur = self.savings.state.total_savings_eur
-                self.state.savings.monthly_savings_eur = self.savings.state.monthly_savings_eur
-                self.state.savings.lifetime_savings_eur = self.savings.state.lifetime_savings_eur
-                self.state.savings.total_charged_kwh = self.savings.state.total_charged_kwh
+                self.state.savings.apply(self.savings.state)
 
     def _sync_pricing(self) -> None:
         """Sync SavingsCalculator pricing with current state.pricing config.
@@ -413,8 +454,8 @@ class NidiaCoordinator:
         # Log at INFO level to ensure visibility
         self._logger.info(
             "SCHEDULED_EVENTS_REGISTERED",
-            window_start=f"{self.state.window_start_hour:02d}:{self.state.window_start_minute:02d}",
-            window_end=f"{self.state.window_end_hour:02d}:{self.state.window_end_minute:02d}",
+            window_start=f"{self.state.window_start_time:%H:%M}",
+            window_end=f"{self.state.window_end_time:%H:%M}",
             listeners_count=len(self._listeners)
         )
 
@@ -503,7 +544,9 @@ class NidiaCoordinator:
         deleted = self.forecaster.delete_record(date_str)
         if deleted:
             # Sync state
-            self.state.consumption.history = list(self.forecaster.history)
+            self.state.consumption.set_history(
+                self.forecaster.history, self.forecaster.weekday_averages
+            )
 
             # Save to storage
             await self._save_data()
@@ -520,6 +563,7 @@ class NidiaCoordinator:
         for remove in self._listeners:
             remove()
         self._listeners.clear()
+        self.events.cancel_dispatch()
 
         self.hass.services.async_remove(DOMAIN, "recalculate_plan_now")
         self.hass.services.async_remove(DOMAIN, "force_charge_tonight")
@@ -536,42 +580,50 @@ class NidiaCoordinator:
 
         # Close day in forecaster
         record = self.forecaster.close_day(now)
-        self._logger.info(
-            "DAY_CLOSED",
-            date=record.date,
-            consumption_kwh=record.consumption_kwh
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "DAY_CLOSED",
+                date=record.date,
+                consumption_kwh=record.consumption_kwh
+            )
         # Sync state for weekday average sensors and current day reset.
-        self.state.consumption.history = list(self.forecaster.history)
+        self.state.consumption.set_history(
+            self.forecaster.history, self.forecaster.weekday_averages
+        )
         self.state.consumption.current_day_kwh = self.forecaster.current_day_consumption
 
         # Save to storage
         await self._save_data()
 
         # Update sensors
-        self._update_sensors()
-
-        await self.events.emit(NidiaEvent.MIDNIGHT, date=record.date)
+        batch: list[tuple[NidiaEvent, dict]] = []
+        self._queue_event(batch, NidiaEvent.UI_UPDATE)
+        self._queue_event(batch, NidiaEvent.MIDNIGHT, date=record.date)
+        await self._flush_events(batch)
 
     async def _handle_window_start(self, now: datetime) -> None:
         """Handle window start - Start charging window."""
         self._logger.separator("CHARGING WINDOW START")
-        self._logger.info(
-            "WINDOW_START_HANDLER",
-            triggered_at=now.strftime("%Y-%m-%d %H:%M:%S"),
-            expected_time=f"{self.state.window_start_hour:02d}:{self.state.window_start_minute:02d}",
-            ev_energy_at_start=self.state.ev.energy_kwh,
-            ev_timer_start=self.state.ev.timer_start
-        )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(
+                "WINDOW_START_HANDLER",
+                triggered_at=now.isoformat(sep=" ", timespec="seconds"),
+                expected_time=f"{self.state.window_start_time:%H:%M}",
+                ev_energy_at_start=self.state.ev.energy_kwh,
+                ev_timer_start=self.state.ev.timer_start
+            )
 
         self.state.is_in_charging_window = True
+        batch: list[tuple[NidiaEvent, dict]] = []
 
         # Check if EV was pre-set
         ev_energy = self.state.ev.energy_kwh
         if ev_energy > 0:
             self._logger.info("EV_PRESET_DETECTED", energy_kwh=ev_energy)
             # Process EV energy (this will calculate plan with EV)
-            await self.handle_ev_energy_change(ev_energy)
+            await self._process_ev_energy_change(
+                batch, ev_energy, force_recalculate=True
+            )
         else:
             # Calculate normal plan
             await self.recalculate_plan(for_preview=False)
@@ -587,9 +639,9 @@ class NidiaCoordinator:
             await self._start_charging()
 
         # Update sensors
-        self._update_sensors()
-
-        await self.events.emit(NidiaEvent.WINDOW_OPENED)
+        self._queue_event(batch, NidiaEvent.UI_UPDATE)
+        self._queue_event(batch, NidiaEvent.WINDOW_OPENED)
+        await self._flush_events(batch)
 
     async def _handle_window_end(self, now: datetime) -> None:
         """Handle window end - End charging window."""
@@ -627,9 +679,10 @@ class NidiaCoordinator:
         self.state.current_session = ChargeSession()
 
         # Update sensors
-        self._update_sensors()
-
-        await self.events.emit(NidiaEvent.WINDOW_CLOSED)
+        batch: list[tuple[NidiaEvent, dict]] = []
+        self._queue_event(batch, NidiaEvent.UI_UPDATE)
+        self._queue_event(batch, NidiaEvent.WINDOW_CLOSED)
+        await self._flush_events(batch)
 
     async def _monitor_charging(self, now: datetime) -> None:
         """Monitor charging progress every minute."""
@@ -640,18 +693,21 @@ class NidiaCoordinator:
         target_soc = self.state.current_plan.target_soc_percent
 
         if current_soc >= target_soc or current_soc >= 99.0:
-            self._logger.info(
-                "TARGET_REACHED",
-                current_soc=current_soc,
-                target_soc=target_soc
-            )
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info(
+                    "TARGET_REACHED",
+                    current_soc=current_soc,
+                    target_soc=target_soc
+                )
             await self._stop_charging(early=True)
             await self.notifier.send_end_notification(
                 self.state.current_session,
                 early_completion=True
             )
-            await self.events.emit(NidiaEvent.TARGET_REACHED, soc=current_soc)
-            self._update_sensors()
+            batch: list[tuple[NidiaEvent, dict]] = []
+            self._queue_event(batch, NidiaEvent.TARGET_REACHED, soc=current_soc)
+            self._queue_event(batch, NidiaEvent.UI_UPDATE)
+            await self._flush_events(batch)
 
     def _handle_power_change(self, event) -> None:
         """Handle power sensor change for consumption tracking with debouncing."""
@@ -708,6 +764,7 @@ class NidiaCoordinator:
         )
         self.state.is_charging_active = True
 
+        # Emitted right away so it stays in order with the switch events
         await self.events.emit_charging_started(
             current_soc, self.state.current_plan.target_soc_percent
         )
@@ -747,23 +804,22 @@ class NidiaCoordinator:
                 charged_kwh=session.charged_kwh,
                 charge_date=date.today(),
             )
-            self._logger.info(
-                "SAVINGS_RECORDED",
-                charged_kwh=session.charged_kwh,
-                savings_eur=savings_record.savings,
-                night_rate=self.savings.get_night_rate(),
-                day_rate=self.savings.get_day_rate(),
-            )
+            if self._logger.isEnabledFor(logging.INFO):
+                self._logger.info(
+                    "SAVINGS_RECORDED",
+                    charged_kwh=session.charged_kwh,
+                    savings_eur=savings_record.savings,
+                    night_rate=self.savings.get_night_rate(),
+                    day_rate=self.savings.get_day_rate(),
+                )
 
             # Update state with savings
-            self.state.savings.total_savings_eur = self.savings.state.total_savings_eur
-            self.state.savings.monthly_savings_eur = self.savings.state.monthly_savings_eur
-            self.state.savings.lifetime_savings_eur = self.savings.state.lifetime_savings_eur
-            self.state.savings.total_charged_kwh = self.savings.state.total_charged_kwh
+            self.state.savings.apply(self.savings.state)
 
             # Save to storage
             await self._save_data()
 
+        # Emitted right away so it stays in order with the switch events
         await self.events.emit_charging_stopped(
             session.end_soc, session.charged_kwh, early
         )
@@ -771,8 +827,52 @@ class NidiaCoordinator:
     # ========== Plan Calculation ==========
 
     async def recalculate_plan(self, for_preview: bool = True) -> None:
-        """Recalculate the charge plan."""
-        self._logger.info("RECALCULATE_PLAN", for_preview=for_preview)
+        """Recalculate the charge plan and publish the result.
+
+        Every recalculation goes through here. Calls arriving while one is
+        in flight mark the plan dirty and wait for the running call, which
+        recalculates once more. Each caller returns only after a plan
+        including its change was published.
+
+        Once a caller asked for the tonight plan (for_preview=False, e.g.
+        window start), later runs of the same flight stay non-preview, so
+        a preview request joining in cannot replace the plan window start
+        acts on.
+        """
+        self._recalc_dirty = True
+        if self._recalc_done is not None:
+            self._recalc_for_preview = self._recalc_for_preview and for_preview
+            # From an event handler of the running call, waiting would
+            # deadlock; the running loop picks the change up instead
+            if not _RECALC_RUNNING.get():
+                await asyncio.shield(self._recalc_done)
+            return
+
+        self._recalc_for_preview = for_preview
+        self._recalc_done = done = self.hass.loop.create_future()
+        token = _RECALC_RUNNING.set(True)
+        try:
+            while self._recalc_dirty:
+                self._recalc_dirty = False
+                batch: list[tuple[NidiaEvent, dict]] = []
+                await self._recalculate_plan(batch, self._recalc_for_preview)
+                await self._flush_events(batch)
+        finally:
+            _RECALC_RUNNING.reset(token)
+            self._recalc_done = None
+            done.set_result(None)
+
+    async def _recalculate_plan(
+        self, batch: list[tuple[NidiaEvent, dict]], for_preview: bool = True
+    ) -> None:
+        """Recalculate the charge plan.
+
+        Only called by recalculate_plan(). Queues PLAN_UPDATED on its
+        batch, which also refreshes the entities once flushed.
+        """
+        log_info = self._logger.isEnabledFor(logging.INFO)
+        if log_info:
+            self._logger.info("RECALCULATE_PLAN", for_preview=for_preview)
 
         # Gather inputs
         current_soc = self.hardware.get_battery_soc()
@@ -785,7 +885,7 @@ class NidiaCoordinator:
 
         # Get EV energy (0 if ignored)
         ev_energy = 0.0 if self.state.ignore_ev_in_calculations else self.state.ev.energy_kwh
-        if self.state.ignore_ev_in_calculations and self.state.ev.energy_kwh > 0:
+        if log_info and self.state.ignore_ev_in_calculations and self.state.ev.energy_kwh > 0:
             self._logger.info(
                 "EV_IGNORED_IN_CALCULATION",
                 actual_ev_kwh=self.state.ev.energy_kwh
@@ -818,20 +918,20 @@ class NidiaCoordinator:
             solar_forecast_kwh=result.solar_forecast_kwh,
         )
 
-        self._logger.info(
-            "PLAN_CALCULATED",
+        if log_info:
+            self._logger.info(
+                "PLAN_CALCULATED",
+                target_soc=result.target_soc_percent,
+                charge_kwh=result.planned_charge_kwh,
+                scheduled=result.is_charging_scheduled
+            )
+
+        self._queue_event(
+            batch,
+            NidiaEvent.PLAN_UPDATED,
             target_soc=result.target_soc_percent,
             charge_kwh=result.planned_charge_kwh,
-            scheduled=result.is_charging_scheduled
-        )
-
-        # Update sensors
-        self._update_sensors()
-
-        await self.events.emit_plan_updated(
-            result.target_soc_percent,
-            result.planned_charge_kwh,
-            "recalculate"
+            reason="recalculate",
         )
 
     # ========== EV Handling ==========
@@ -841,10 +941,30 @@ class NidiaCoordinator:
 
         This is the SINGLE ENTRY POINT for all EV changes.
         """
-        self._logger.separator("EV ENERGY CHANGE")
-        self._logger.info("EV_CHANGE_START", value=value)
+        batch: list[tuple[NidiaEvent, dict]] = []
+        await self._process_ev_energy_change(batch, value)
+        await self._flush_events(batch)
+
+    async def _process_ev_energy_change(
+        self,
+        batch: list[tuple[NidiaEvent, dict]],
+        value: float,
+        force_recalculate: bool = False,
+    ) -> None:
+        """Apply an EV energy change, queueing its events on the batch.
+
+        Args:
+            batch: Events of the calling handler, flushed by the caller
+            value: New EV energy in kWh
+            force_recalculate: Recalculate the plan even if nothing changed
+        """
+        log_info = self._logger.isEnabledFor(logging.INFO)
+        if log_info:
+            self._logger.separator("EV ENERGY CHANGE")
+            self._logger.info("EV_CHANGE_START", value=value)
 
         old_value = self.state.ev.energy_kwh
+        old_bypass = self.state.ev.bypass_active
         now = dt_util.now()
 
         # Get energy balance for decision
@@ -879,71 +999,95 @@ class NidiaCoordinator:
         # Apply decision
         self.state.ev.energy_kwh = decision.value
 
-        if decision.result == EVSetResult.SAVED:
+        if decision.result is EVSetResult.SAVED:
             # Outside window - just save
-            self._logger.info("EV_SAVED_FOR_LATER", value=decision.value)
+            if log_info:
+                self._logger.info("EV_SAVED_FOR_LATER", value=decision.value)
 
-        elif decision.result == EVSetResult.RESET:
+        elif decision.result is EVSetResult.RESET:
             # Reset to 0
-            self._logger.info("EV_RESET")
+            if log_info:
+                self._logger.info("EV_RESET")
             self.state.ev.reset()
-            await self.hardware.set_bypass(False)
+            if self.state.ev.bypass_active:
+                await self.hardware.set_bypass(False)
 
-        elif decision.result == EVSetResult.PROCESSED:
+        elif decision.result is EVSetResult.PROCESSED:
             # In window - full processing
-            self._logger.info(
-                "EV_PROCESSED",
-                value=decision.value,
-                bypass=decision.bypass_should_activate,
-                ignored=self.state.ignore_ev_in_calculations
-            )
+            if log_info:
+                self._logger.info(
+                    "EV_PROCESSED",
+                    value=decision.value,
+                    bypass=decision.bypass_should_activate,
+                    ignored=self.state.ignore_ev_in_calculations
+                )
 
             # Start timer if needed (only if EV is not ignored)
             if decision.value > 0 and self.state.ev.timer_start is None and not self.state.ignore_ev_in_calculations:
                 self.state.ev.timer_start = now
-                self._logger.info("EV_TIMER_STARTED")
+                if log_info:
+                    self._logger.info("EV_TIMER_STARTED")
 
             # Control bypass
             # When ignore_ev is ON: bypass is ALWAYS active
             # When ignore_ev is OFF: bypass follows normal EV logic
             if self.state.ignore_ev_in_calculations:
-                self._logger.info("EV_BYPASS_FORCED_ON_IGNORED_MODE")
-                await self.hardware.set_bypass(True)
-                self.state.ev.bypass_active = True
-            elif decision.bypass_should_activate:
-                await self.hardware.set_bypass(True)
-                self.state.ev.bypass_active = True
+                if log_info:
+                    self._logger.info("EV_BYPASS_FORCED_ON_IGNORED_MODE")
+                bypass_wanted = True
             else:
-                await self.hardware.set_bypass(False)
-                self.state.ev.bypass_active = False
+                bypass_wanted = decision.bypass_should_activate
+
+            # Only touch the switch when the bypass actually has to change
+            if self.state.ev.bypass_active != bypass_wanted:
+                await self.hardware.set_bypass(bypass_wanted)
 
             # Handle timeout notification (only if not ignored)
             if decision.is_timeout and not self.state.ignore_ev_in_calculations:
                 elapsed = EVManager.get_elapsed_hours(self.state.ev.timer_start, now)
                 await self.notifier.send_ev_timeout_notification(decision.value, elapsed)
 
+        # Planner inputs only change with the EV value or the bypass state
+        changed = (
+            force_recalculate
+            or decision.result is EVSetResult.RESET
+            or decision.value != old_value
+            or self.state.ev.bypass_active != old_bypass
+        )
+        if not changed and log_info:
+            self._logger.info("EV_UNCHANGED_SKIP_RECALCULATE", value=decision.value)
+
         # Recalculate plan with EV
-        await self.recalculate_plan(for_preview=not self.state.is_in_charging_window)
+        if changed:
+            await self.recalculate_plan(
+                for_preview=not self.state.is_in_charging_window
+            )
 
         # Send update notification if in window
-        if self.state.is_in_charging_window and decision.result == EVSetResult.PROCESSED:
-            # Calculate old plan for comparison
-            old_plan = self.state.current_plan  # Before recalculation
+        if (
+            changed
+            and self.state.is_in_charging_window
+            and decision.result is EVSetResult.PROCESSED
+        ):
             await self.notifier.send_update_notification(
                 ev_energy_kwh=decision.value,
-                old_plan=ChargePlan(),  # Empty as baseline
+                old_plan=_EMPTY_CHARGE_PLAN,  # Empty as baseline
                 new_plan=self.state.current_plan,
                 bypass_activated=decision.bypass_should_activate,
                 energy_balance=energy_balance,
             )
 
-        # Emit event
-        await self.events.emit_ev_set(
-            decision.value,
-            decision.bypass_should_activate
+        # Emit event (UI_UPDATE folds into PLAN_UPDATED's refresh if queued)
+        self._queue_event(batch, NidiaEvent.UI_UPDATE)
+        self._queue_event(
+            batch,
+            NidiaEvent.EV_ENERGY_SET,
+            energy_kwh=decision.value,
+            bypass_activated=decision.bypass_should_activate,
         )
 
-        self._logger.info("EV_CHANGE_COMPLETE", result=decision.result.value)
+        if log_info:
+            self._logger.info("EV_CHANGE_COMPLETE", result=decision.result.value)
 
     async def handle_ev_restored(self, value: float) -> None:
         """Handle EV value restored from HA storage."""
@@ -965,26 +1109,46 @@ class NidiaCoordinator:
     # ========== Override Handlers ==========
 
     async def set_force_charge(self, enabled: bool) -> None:
-        """Set force charge override."""
+        """Set force charge override (enabling clears disable)."""
         self.state.force_charge_enabled = enabled
-        if enabled:
-            self.state.disable_charge_enabled = False
         self._logger.info("FORCE_CHARGE_SET", enabled=enabled)
         await self.recalculate_plan(for_preview=True)
 
     async def set_disable_charge(self, enabled: bool) -> None:
-        """Set disable charge override."""
+        """Set disable charge override (enabling clears force)."""
         self.state.disable_charge_enabled = enabled
-        if enabled:
-            self.state.force_charge_enabled = False
         self._logger.info("DISABLE_CHARGE_SET", enabled=enabled)
         await self.recalculate_plan(for_preview=True)
 
     # ========== Utility ==========
 
     def _update_sensors(self) -> None:
-        """Notify all sensors to update."""
-        async_dispatcher_send(self.hass, "night_battery_charger_update")
+        """Notify all sensors to update (debounced by the event bus)."""
+        self.events.request_dispatch()
+
+    def _queue_event(
+        self, batch: list[tuple[NidiaEvent, dict]], event: NidiaEvent, **data
+    ) -> None:
+        """Queue an event on a handler's batch, emitted by _flush_events().
+
+        Each handler owns its batch, so events never leak into another
+        handler's flush. Events nobody listens to are dropped unless the
+        debug event log would record them.
+        """
+        if self.events.has_handlers(event) or self._logger.isEnabledFor(logging.DEBUG):
+            batch.append((event, data))
+
+    async def _flush_events(self, batch: list[tuple[NidiaEvent, dict]]) -> None:
+        """Emit a batch's events once each, with a single entity refresh.
+
+        Repeated events keep their first position and their latest data.
+        """
+        if not batch:
+            return
+
+        pending = dict(batch)
+        batch.clear()
+        await self.events.emit_many(pending.items())
 
     def get_savings_summary(self) -> dict:
         """Get savings summary for sensors."""
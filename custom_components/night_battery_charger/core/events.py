@@ -9,12 +9,15 @@ This makes the system:
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Awaitable
+from typing import TYPE_CHECKING, Any, Callable, Awaitable, Iterable
 
-from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.util import dt as dt_util
 
 from ..nidia_logging import get_logger
 
@@ -64,7 +67,7 @@ class NidiaEvent(str, Enum):
     UI_UPDATE = "nidia.ui_update"
 
 
-@dataclass
+@dataclass(slots=True)
 class EventData:
     """Container for event data."""
 
@@ -84,6 +87,19 @@ class EventData:
 # Type alias for event handlers
 EventHandler = Callable[[EventData], Awaitable[None]]
 
+# Entity update listeners must be @callback functions, they run directly
+# in the event loop
+UpdateListener = CALLBACK_TYPE
+
+# Events that also refresh HA entities
+_DISPATCH_EVENTS = frozenset({NidiaEvent.UI_UPDATE, NidiaEvent.PLAN_UPDATED})
+
+# Entity refreshes requested within this window go out as one dispatch
+DISPATCH_DEBOUNCE_SECONDS = 0.05
+
+# Log event names, built once instead of formatting event.name per emit
+_LOG_NAMES = {event: f"EVENT_{event.name}" for event in NidiaEvent}
+
 
 class NidiaEventBus:
     """Central event bus for the integration.
@@ -100,7 +116,15 @@ class NidiaEventBus:
         """
         self.hass = hass
         self._logger = get_logger()
-        self._handlers: dict[NidiaEvent, list[EventHandler]] = {}
+        # Immutable snapshots of (handler, name), rebuilt on (un)subscribe
+        # so emit() never copies
+        self._handlers: dict[NidiaEvent, tuple[tuple[EventHandler, str], ...]] = {}
+        # Entity update callbacks, keyed by their registration token
+        self._update_listeners: dict[object, UpdateListener] = {}
+        # Bumped on every entity refresh, lets entities cache derived data
+        self.version = 0
+        # Scheduled entity refresh, see request_dispatch()
+        self._pending_dispatch: asyncio.TimerHandle | None = None
 
         self._logger.info("EVENT_BUS_INITIALIZED")
 
@@ -111,34 +135,133 @@ class NidiaEventBus:
             event: Event type to emit
             **data: Event data
         """
-        event_data = EventData(
-            event=event,
-            timestamp=datetime.now(),
-            data=data,
-        )
+        await self._notify(event, data)
 
-        # Log the event
-        self._logger.debug(
-            f"EVENT_{event.name}",
-            **data
+        # Also refresh the HA entities
+        if event in _DISPATCH_EVENTS:
+            self.request_dispatch()
+
+    async def emit_many(
+        self, events: Iterable[tuple[NidiaEvent, dict[str, Any]]]
+    ) -> None:
+        """Emit several events, refreshing HA entities at most once.
+
+        Args:
+            events: (event, data) pairs in emission order
+        """
+        dispatch = False
+        for event, data in events:
+            await self._notify(event, data)
+            dispatch = dispatch or event in _DISPATCH_EVENTS
+
+        if dispatch:
+            self.request_dispatch()
+
+    @callback
+    def request_dispatch(self) -> None:
+        """Schedule an HA entity refresh.
+
+        Requests arriving while one is already scheduled are folded into it,
+        so a burst of state changes makes the entities write their state once.
+        """
+        if self._pending_dispatch is not None:
+            return
+        self._pending_dispatch = self.hass.loop.call_later(
+            DISPATCH_DEBOUNCE_SECONDS, self._flush_dispatch
         )
 
-        # Call registered handlers
-        handlers = self._handlers.get(event, [])
-        for handler in handlers:
+    @callback
+    def cancel_dispatch(self) -> None:
+        """Drop a scheduled entity refresh (on unload)."""
+        if self._pending_dispatch is not None:
+            self._pending_dispatch.cancel()
+            self._pending_dispatch = None
+
+    @callback
+    def _flush_dispatch(self) -> None:
+        """Send the scheduled entity refresh."""
+        self._pending_dispatch = None
+        self.async_update_listeners()
+
+    @callback
+    def async_add_listener(self, update_callback: UpdateListener) -> CALLBACK_TYPE:
+        """Register an entity update callback.
+
+        Args:
+            update_callback: Called (in the event loop) on every entity refresh
+
+        Returns:
+            Function removing the listener
+        """
+        token = object()
+        self._update_listeners[token] = update_callback
+
+        @callback
+        def remove_listener() -> None:
+            self._update_listeners.pop(token, None)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Run all entity update callbacks.
+
+        A failing callback is logged and the remaining entities still refresh.
+        """
+        self.version += 1
+        for update_callback in list(self._update_listeners.values()):
             try:
-                await handler(event_data)
+                update_callback()
             except Exception as ex:
                 self._logger.error(
-                    "EVENT_HANDLER_ERROR",
-                    event=event.name,
-                    handler=handler.__name__,
-                    error=str(ex)
+                    "ENTITY_UPDATE_ERROR",
+                    # Bound _handle_update methods are reported by entity
+                    listener=getattr(update_callback, "__self__", update_callback),
+                    error=ex
                 )
 
-        # Also dispatch to HA for entity updates
-        if event == NidiaEvent.UI_UPDATE or event == NidiaEvent.PLAN_UPDATED:
-            async_dispatcher_send(self.hass, "night_battery_charger_update")
+    async def _notify(self, event: NidiaEvent, data: dict[str, Any]) -> None:
+        """Log an event and run its registered handlers."""
+        # Log the event
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                _LOG_NAMES[event],
+                **data
+            )
+
+        # Call registered handlers
+        handlers = self._handlers.get(event)
+        if handlers:
+            event_data = EventData(
+                event=event,
+                timestamp=dt_util.utcnow(),
+                data=data,
+            )
+            # Handlers are independent, run them concurrently
+            await asyncio.gather(
+                *(self._safe_call(handler, name, event_data) for handler, name in handlers)
+            )
+
+    async def _safe_call(
+        self, handler: EventHandler, name: str, event_data: EventData
+    ) -> None:
+        """Run one handler, logging instead of raising on failure."""
+        try:
+            await handler(event_data)
+        except Exception as ex:
+            self._logger.error(
+                "EVENT_HANDLER_ERROR",
+                event_name=event_data.event.name,
+                handler=name,
+                error=ex
+            )
+
+    def has_handlers(self, event: NidiaEvent) -> bool:
+        """Check whether emitting the event would reach anything.
+
+        True if a handler is registered or the event refreshes HA entities.
+        """
+        return event in self._handlers or event in _DISPATCH_EVENTS
 
     def on(self, event: NidiaEvent, handler: EventHandler) -> Callable[[], None]:
         """Register an event handler.
@@ -150,13 +273,11 @@ class NidiaEventBus:
         Returns:
             Unsubscribe function
         """
-        if event not in self._handlers:
-            self._handlers[event] = []
-
-        self._handlers[event].append(handler)
+        entry = (handler, getattr(handler, "__qualname__", None) or repr(handler))
+        self._handlers[event] = self._handlers.get(event, ()) + (entry,)
 
         def unsubscribe():
-            self._handlers[event].remove(handler)
+            self.off(event, handler)
 
         return unsubscribe
 
@@ -167,12 +288,34 @@ class NidiaEventBus:
             event: Event type
             handler: Handler to remove
         """
-        if event in self._handlers and handler in self._handlers[event]:
-            self._handlers[event].remove(handler)
+        handlers = self._handlers.get(event)
+        if handlers is None:
+            return
+
+        # Drop only the first registration, like list.remove()
+        index = next(
+            (i for i, (registered, _) in enumerate(handlers) if registered == handler),
+            None,
+        )
+        if index is None:
+            return
+        remaining = handlers[:index] + handlers[index + 1:]
+        if remaining:
+            self._handlers[event] = remaining
+        else:
+            del self._handlers[event]
 
     async def emit_state_update(self) -> None:
-        """Convenience method to emit UI update event."""
-        await self.emit(NidiaEvent.UI_UPDATE)
+        """Convenience method to emit UI update event.
+
+        Without UI_UPDATE subscribers this is only an entity refresh, so it
+        goes straight to the entity listeners instead of through emit().
+        """
+        if NidiaEvent.UI_UPDATE in self._handlers:
+            await self.emit(NidiaEvent.UI_UPDATE)
+            return
+
+        self.request_dispatch()
 
     async def emit_plan_updated(
         self,
@@ -15,6 +15,9 @@ Benefits:
 from __future__ import annotations
 
 import asyncio
+import logging
+import random
+import time
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
@@ -37,9 +40,14 @@ class HardwareController:
     - Error handling and logging
     """
 
-    # Retry configuration
+    # Retry configuration (exponential backoff with jitter)
     MAX_RETRIES = 3
-    RETRY_DELAY_SECONDS = 1.0
+    RETRY_BASE_DELAY_SECONDS = 0.1
+    RETRY_MAX_DELAY_SECONDS = 1.0
+    RETRY_JITTER_SECONDS = 0.05
+
+    # SOC reads younger than this are reused by get_battery_energy_kwh
+    SOC_REUSE_SECONDS = 0.25
 
     def __init__(
         self,
@@ -59,9 +67,9 @@ class HardwareController:
         self.events = events
         self._logger = get_logger()
 
-        # Internal state tracking
-        self._inverter_state: bool = False
-        self._bypass_state: bool = False
+        # Parsed sensor values keyed by entity_id -> (state.last_updated, value)
+        self._sensor_cache: dict[str, tuple[Any, float]] = {}
+        self._soc_last_read_monotonic: float = 0.0
 
         self._logger.info("HARDWARE_CONTROLLER_INITIALIZED")
 
@@ -92,20 +100,27 @@ class HardwareController:
             self._logger.warning(f"{sensor_name.upper()}_NOT_FOUND", entity_id=entity_id)
             return default
 
+        # Same state object as last read - skip re-validating and parsing
+        cached = self._sensor_cache.get(entity_id)
+        if cached is not None and cached[0] == state.last_updated:
+            return cached[1]
+
         if state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
             self._logger.warning(f"{sensor_name.upper()}_UNAVAILABLE", entity_id=entity_id)
             return default
 
         try:
             value = float(state.state)
-            self._logger.debug(f"{sensor_name.upper()}_READ", entity_id=entity_id, value=value)
+            self._sensor_cache[entity_id] = (state.last_updated, value)
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(f"{sensor_name.upper()}_READ", entity_id=entity_id, value=value)
             return value
         except (ValueError, TypeError) as ex:
             self._logger.error(
                 f"{sensor_name.upper()}_INVALID_VALUE",
                 entity_id=entity_id,
                 value=state.state,
-                error=str(ex)
+                error=ex
             )
             return default
 
@@ -122,6 +137,7 @@ class HardwareController:
         )
         # Update state
         self.state.current_soc = soc
+        self._soc_last_read_monotonic = time.monotonic()
         return soc
 
     def get_battery_energy_kwh(self) -> float:
@@ -130,7 +146,10 @@ class HardwareController:
         Returns:
             Battery energy in kWh
         """
-        soc = self.get_battery_soc()
+        if time.monotonic() - self._soc_last_read_monotonic < self.SOC_REUSE_SECONDS:
+            soc = self.state.current_soc
+        else:
+            soc = self.get_battery_soc()
         return (soc / 100.0) * self.state.battery_capacity_kwh
 
     def get_solar_forecast(self, for_tomorrow: bool = False) -> float:
@@ -209,10 +228,14 @@ class HardwareController:
                     entity_id=entity_id,
                     service=service,
                     attempt=attempt + 1,
-                    error=str(ex)
+                    error=ex
                 )
                 if attempt < self.MAX_RETRIES - 1:
-                    await asyncio.sleep(self.RETRY_DELAY_SECONDS)
+                    delay = min(
+                        self.RETRY_MAX_DELAY_SECONDS,
+                        self.RETRY_BASE_DELAY_SECONDS * (2 ** attempt),
+                    )
+                    await asyncio.sleep(delay + random.random() * self.RETRY_JITTER_SECONDS)
 
         # All retries failed
         self._logger.error(
@@ -243,7 +266,7 @@ class HardwareController:
             "inverter"
         )
         if success:
-            self._inverter_state = enable
+            self.state.inverter_on = enable
             event = NidiaEvent.INVERTER_ON if enable else NidiaEvent.INVERTER_OFF
             await self.events.emit(event)
         return success
@@ -258,11 +281,12 @@ class HardwareController:
             True if successful
         """
         # Skip if already in desired state
-        if self._bypass_state == enable:
-            self._logger.debug(
-                "BYPASS_ALREADY_SET",
-                current_state=enable
-            )
+        if self.state.ev.bypass_active == enable:
+            if self._logger.isEnabledFor(logging.DEBUG):
+                self._logger.debug(
+                    "BYPASS_ALREADY_SET",
+                    current_state=enable
+                )
             return True
 
         success = await self._call_switch_service(
@@ -271,41 +295,48 @@ class HardwareController:
             "bypass"
         )
         if success:
-            self._bypass_state = enable
             self.state.ev.bypass_active = enable
             event = NidiaEvent.BYPASS_ON if enable else NidiaEvent.BYPASS_OFF
             await self.events.emit(event)
         return success
 
-    def sync_bypass_state(self) -> None:
-        """Sync internal bypass state with actual switch state.
+    def sync_hardware_state(self) -> None:
+        """Sync tracked switch states with the actual switch states.
 
-        Call this after HA restart to ensure consistency.
+        Call this after HA restart to ensure consistency. All configured
+        switches are checked in a single pass.
         """
-        if not self.state.bypass_switch_entity:
-            return
+        switches = (
+            ("bypass", self.state.bypass_switch_entity, self.state.ev, "bypass_active"),
+            ("inverter", self.state.inverter_switch_entity, self.state, "inverter_on"),
+        )
+        for name, entity_id, target, attr in switches:
+            if not entity_id:
+                continue
+
+            state = self.hass.states.get(entity_id)
+            if state is None or state.state in (STATE_UNKNOWN, STATE_UNAVAILABLE):
+                continue
 
-        state = self.hass.states.get(self.state.bypass_switch_entity)
-        if state and state.state not in (STATE_UNKNOWN, STATE_UNAVAILABLE):
             actual_state = state.state == "on"
-            if actual_state != self._bypass_state:
+            tracked_state = getattr(target, attr)
+            if actual_state != tracked_state:
                 self._logger.info(
-                    "BYPASS_STATE_SYNCED",
-                    internal=self._bypass_state,
+                    f"{name.upper()}_STATE_SYNCED",
+                    internal=tracked_state,
                     actual=actual_state
                 )
-                self._bypass_state = actual_state
-                self.state.ev.bypass_active = actual_state
+                setattr(target, attr, actual_state)
 
     @property
     def is_inverter_on(self) -> bool:
         """Check if inverter is on."""
-        return self._inverter_state
+        return self.state.inverter_on
 
     @property
     def is_bypass_on(self) -> bool:
         """Check if bypass is on."""
-        return self._bypass_state
+        return self.state.ev.bypass_active
 
     # ========== Notifications ==========
 
@@ -323,19 +354,17 @@ class HardwareController:
             self._logger.debug("NOTIFY_SERVICE_NOT_CONFIGURED")
             return False
 
-        if "." not in notify_service:
+        parts = self.state.notify_service_parts
+        if parts is None:
             self._logger.error(
                 "NOTIFY_SERVICE_INVALID_FORMAT",
                 service=notify_service
             )
             return False
 
-        domain, service = notify_service.split(".", 1)
-
         try:
             await self.hass.services.async_call(
-                domain,
-                service,
+                *parts,
                 {"message": message},
             )
             self._logger.info("NOTIFICATION_SENT", length=len(message))
@@ -346,6 +375,6 @@ class HardwareController:
             self._logger.error(
                 "NOTIFICATION_FAILED",
                 service=notify_service,
-                error=str(ex)
+                error=ex
             )
             return False
@@ -12,14 +12,56 @@ Benefits:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import logging
+from dataclasses import dataclass, field, fields
 from datetime import datetime, time
-from typing import Any
+from enum import IntEnum
+from typing import Any, ClassVar, Sequence
 
 from ..nidia_logging import get_logger
 
 
-@dataclass
+class OverrideMode(IntEnum):
+    """Tonight's charge override (force and disable are mutually exclusive)."""
+
+    NONE = 0
+    FORCE = 1
+    DISABLE = 2
+
+
+def _compile_to_dict(cls: type) -> type:
+    """Generate a straight-line dict export from the class field tuples.
+
+    Builds ``_fields_to_dict`` returning one dict literal over
+    ``_DICT_FIELDS``, with ``_DT_FIELDS`` exported as ISO strings. It also
+    becomes ``to_dict`` unless the class defines its own (which can call
+    ``_fields_to_dict`` and then add its special cases).
+    """
+    dt_fields = getattr(cls, "_DT_FIELDS", ())
+    items = []
+    for name in cls._DICT_FIELDS:
+        if name in dt_fields:
+            items.append(
+                f"        {name!r}: self.{name}.isoformat() if self.{name} else self.{name},"
+            )
+        else:
+            items.append(f"        {name!r}: self.{name},")
+    source = "def _fields_to_dict(self):\n    return {\n" + "\n".join(items) + "\n    }\n"
+
+    namespace: dict[str, Any] = {}
+    exec(source, {}, namespace)  # noqa: S102 - source built from class constants
+    fields_to_dict = namespace["_fields_to_dict"]
+    fields_to_dict.__qualname__ = f"{cls.__qualname__}._fields_to_dict"
+    fields_to_dict.__doc__ = "Convert to dictionary."
+
+    cls._fields_to_dict = fields_to_dict
+    if "to_dict" not in cls.__dict__:
+        cls.to_dict = fields_to_dict
+    return cls
+
+
+@_compile_to_dict
+@dataclass(slots=True)
 class ChargePlan:
     """Charging plan calculated by the planner."""
 
@@ -30,19 +72,34 @@ class ChargePlan:
     load_forecast_kwh: float = 0.0
     solar_forecast_kwh: float = 0.0
 
+    _DICT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "target_soc_percent",
+        "planned_charge_kwh",
+        "is_charging_scheduled",
+        "reasoning",
+        "load_forecast_kwh",
+        "solar_forecast_kwh",
+    )
+
+    # Truncated reasoning for to_dict(), re-sliced only when reasoning changes
+    _reasoning_source: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _reasoning_short: str = field(default="", init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for logging/serialization."""
-        return {
-            "target_soc_percent": self.target_soc_percent,
-            "planned_charge_kwh": self.planned_charge_kwh,
-            "is_charging_scheduled": self.is_charging_scheduled,
-            "reasoning": self.reasoning[:100] if self.reasoning else "",
-            "load_forecast_kwh": self.load_forecast_kwh,
-            "solar_forecast_kwh": self.solar_forecast_kwh,
-        }
+        data = self._fields_to_dict()
+        reasoning = self.reasoning
+        if reasoning is not self._reasoning_source:
+            self._reasoning_short = reasoning[:100]
+            self._reasoning_source = reasoning
+        data["reasoning"] = self._reasoning_short
+        return data
 
 
-@dataclass
+@_compile_to_dict
+@dataclass(slots=True)
 class ChargeSession:
     """Active charging session tracking."""
 
@@ -52,23 +109,25 @@ class ChargeSession:
     end_soc: float | None = None
     charged_kwh: float = 0.0
 
+    _DICT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "start_time",
+        "start_soc",
+        "end_time",
+        "end_soc",
+        "charged_kwh",
+    )
+
+    # Datetime fields exported as ISO strings by to_dict()
+    _DT_FIELDS: ClassVar[tuple[str, ...]] = ("start_time", "end_time")
+
     @property
     def is_active(self) -> bool:
         """Check if session is active."""
         return self.start_time is not None and self.end_time is None
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for logging/serialization."""
-        return {
-            "start_time": self.start_time.isoformat() if self.start_time else None,
-            "start_soc": self.start_soc,
-            "end_time": self.end_time.isoformat() if self.end_time else None,
-            "end_soc": self.end_soc,
-            "charged_kwh": self.charged_kwh,
-        }
-
 
-@dataclass
+@_compile_to_dict
+@dataclass(slots=True)
 class EVState:
     """EV-related state."""
 
@@ -77,6 +136,15 @@ class EVState:
     bypass_active: bool = False
     timeout_hours: float = 6.0
 
+    _DICT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "energy_kwh",
+        "timer_start",
+        "bypass_active",
+    )
+
+    # Datetime fields exported as ISO strings by to_dict()
+    _DT_FIELDS: ClassVar[tuple[str, ...]] = ("timer_start",)
+
     @property
     def is_timer_active(self) -> bool:
         """Check if timer is running."""
@@ -88,22 +156,22 @@ class EVState:
         return self.energy_kwh > 0
 
     def reset(self) -> None:
-        """Reset all EV state."""
+        """Reset EV energy and timer.
+
+        bypass_active mirrors the physical switch and is only cleared by
+        HardwareController.set_bypass(False).
+        """
         self.energy_kwh = 0.0
         self.timer_start = None
-        self.bypass_active = False
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            "energy_kwh": self.energy_kwh,
-            "timer_start": self.timer_start.isoformat() if self.timer_start else None,
-            "bypass_active": self.bypass_active,
-            "is_timer_active": self.is_timer_active,
-        }
+        data = self._fields_to_dict()
+        data["is_timer_active"] = self.timer_start is not None
+        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsumptionState:
     """Consumption learning state."""
 
@@ -112,14 +180,29 @@ class ConsumptionState:
     last_reading_value: float | None = None
     history: list[dict] = field(default_factory=list)
 
+    # Average consumption per weekday (0=Monday), derived from history
+    weekday_averages: list[float] = field(default_factory=lambda: [0.0] * 7)
+
     def reset_day(self) -> None:
         """Reset daily consumption."""
         self.current_day_kwh = 0.0
         self.last_reading_time = None
         self.last_reading_value = None
 
+    def set_history(
+        self, history: list[dict], weekday_averages: Sequence[float]
+    ) -> None:
+        """Refill history in place and take over the weekday averages.
+
+        The averages come from ConsumptionForecaster, which keeps them up
+        to date with its running weekday sums.
+        """
+        self.history[:] = history
+        self.weekday_averages = list(weekday_averages)
 
-@dataclass
+
+@_compile_to_dict
+@dataclass(slots=True)
 class SavingsState:
     """Economic savings state."""
 
@@ -138,22 +221,28 @@ class SavingsState:
     lifetime_charged_kwh: float = 0.0
     lifetime_savings_eur: float = 0.0
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "total_charged_kwh": self.total_charged_kwh,
-            "total_savings_eur": self.total_savings_eur,
-            "total_cost_eur": self.total_cost_eur,
-            "theoretical_cost_eur": self.theoretical_cost_eur,
-            "monthly_charged_kwh": self.monthly_charged_kwh,
-            "monthly_savings_eur": self.monthly_savings_eur,
-            "current_month": self.current_month,
-            "lifetime_charged_kwh": self.lifetime_charged_kwh,
-            "lifetime_savings_eur": self.lifetime_savings_eur,
-        }
-
-
-@dataclass
+    _DICT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "total_charged_kwh",
+        "total_savings_eur",
+        "total_cost_eur",
+        "theoretical_cost_eur",
+        "monthly_charged_kwh",
+        "monthly_savings_eur",
+        "current_month",
+        "lifetime_charged_kwh",
+        "lifetime_savings_eur",
+    )
+
+    def apply(self, src: Any) -> None:
+        """Copy the sensor-facing totals from the SavingsCalculator state."""
+        self.total_savings_eur = src.total_savings_eur
+        self.monthly_savings_eur = src.monthly_savings_eur
+        self.lifetime_savings_eur = src.lifetime_savings_eur
+        self.total_charged_kwh = src.total_charged_kwh
+
+
+@_compile_to_dict
+@dataclass(slots=True)
 class PricingConfig:
     """Energy pricing configuration."""
 
@@ -164,19 +253,17 @@ class PricingConfig:
     price_f3: float = 0.12
     pricing_mode: str = "two_tier"  # "two_tier" or "three_tier"
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "price_peak": self.price_peak,
-            "price_offpeak": self.price_offpeak,
-            "price_f1": self.price_f1,
-            "price_f2": self.price_f2,
-            "price_f3": self.price_f3,
-            "pricing_mode": self.pricing_mode,
-        }
+    _DICT_FIELDS: ClassVar[tuple[str, ...]] = (
+        "price_peak",
+        "price_offpeak",
+        "price_f1",
+        "price_f2",
+        "price_f3",
+        "pricing_mode",
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class NidiaState:
     """Single Source of Truth - ALL state lives here.
 
@@ -207,10 +294,10 @@ class NidiaState:
     # Runtime state
     current_soc: float = 0.0
     is_charging_active: bool = False
+    inverter_on: bool = False
 
     # Override flags
-    force_charge_enabled: bool = False
-    disable_charge_enabled: bool = False
+    override_mode: OverrideMode = OverrideMode.NONE
     ignore_ev_in_calculations: bool = False
 
     # Complex state objects
@@ -235,19 +322,101 @@ class NidiaState:
     # EV timeout (configurable)
     ev_timeout_hours: float = 6.0
 
+    # Names accepted by update(), filled in after the class body
+    _FIELDS: ClassVar[frozenset[str]]
+
+    # Parsed notify_service, see notify_service_parts
+    _notify_parts_source: str | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _notify_parts: tuple[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Window times built from the hour/minute fields, refreshed by update()
+    _window_start_time: time = field(
+        default=time(0, 1), init=False, repr=False, compare=False
+    )
+    _window_end_time: time = field(
+        default=time(7, 0), init=False, repr=False, compare=False
+    )
+    _window_display: str = field(
+        default="00:01 - 07:00", init=False, repr=False, compare=False
+    )
+
+    _logger: Any = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Initialize logger after dataclass init."""
         self._logger = get_logger()
+        self._refresh_window_times()
 
     @property
     def window_start_time(self) -> time:
         """Get charging window start as time object."""
-        return time(self.window_start_hour, self.window_start_minute)
+        return self._window_start_time
 
     @property
     def window_end_time(self) -> time:
         """Get charging window end as time object."""
-        return time(self.window_end_hour, self.window_end_minute)
+        return self._window_end_time
+
+    @property
+    def window_display(self) -> str:
+        """Get charging window as "HH:MM - HH:MM"."""
+        return self._window_display
+
+    def _refresh_window_times(self) -> None:
+        """Rebuild the window time objects from the hour/minute fields.
+
+        The window fields are only changed through the constructor or
+        update(), which both call this.
+        """
+        self._window_start_time = time(self.window_start_hour, self.window_start_minute)
+        self._window_end_time = time(self.window_end_hour, self.window_end_minute)
+        self._window_display = (
+            f"{self._window_start_time:%H:%M} - {self._window_end_time:%H:%M}"
+        )
+
+    @property
+    def notify_service_parts(self) -> tuple[str, str] | None:
+        """Get notify service as (domain, service), None if not "domain.service".
+
+        Parsed once and re-parsed only when notify_service is reassigned.
+        """
+        if self._notify_parts_source is not self.notify_service:
+            notify_service = self.notify_service
+            if "." in notify_service:
+                domain, service = notify_service.split(".", 1)
+                self._notify_parts = (domain, service)
+            else:
+                self._notify_parts = None
+            self._notify_parts_source = notify_service
+        return self._notify_parts
+
+    @property
+    def force_charge_enabled(self) -> bool:
+        """Check if charging is forced tonight."""
+        return self.override_mode == OverrideMode.FORCE
+
+    @force_charge_enabled.setter
+    def force_charge_enabled(self, enabled: bool) -> None:
+        if enabled:
+            self.override_mode = OverrideMode.FORCE
+        elif self.override_mode == OverrideMode.FORCE:
+            self.override_mode = OverrideMode.NONE
+
+    @property
+    def disable_charge_enabled(self) -> bool:
+        """Check if charging is disabled tonight."""
+        return self.override_mode == OverrideMode.DISABLE
+
+    @disable_charge_enabled.setter
+    def disable_charge_enabled(self, enabled: bool) -> None:
+        if enabled:
+            self.override_mode = OverrideMode.DISABLE
+        elif self.override_mode == OverrideMode.DISABLE:
+            self.override_mode = OverrideMode.NONE
 
     def update(self, **kwargs) -> None:
         """Update state fields and log the change.
@@ -255,21 +424,30 @@ class NidiaState:
         Args:
             **kwargs: Fields to update
         """
-        changes = {}
-        for key, value in kwargs.items():
-            if hasattr(self, key):
-                old_value = getattr(self, key)
-                if old_value != value:
+        valid = self._FIELDS
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            # Nobody will read the change log, just assign
+            for key, value in kwargs.items():
+                if key in valid:
                     setattr(self, key, value)
-                    changes[key] = {"old": old_value, "new": value}
+        else:
+            changes = {}
+            for key, value in kwargs.items():
+                if key in valid:
+                    old_value = getattr(self, key)
+                    if old_value != value:
+                        setattr(self, key, value)
+                        changes[key] = {"old": old_value, "new": value}
+
+            if changes:
+                self._logger.debug("STATE_UPDATED", changes=changes)
 
-        if changes:
-            self._logger.debug("STATE_UPDATED", changes=changes)
+        if not _WINDOW_FIELDS.isdisjoint(kwargs):
+            self._refresh_window_times()
 
     def reset_overrides(self) -> None:
         """Reset all override flags."""
-        self.force_charge_enabled = False
-        self.disable_charge_enabled = False
+        self.override_mode = OverrideMode.NONE
         self._logger.info("OVERRIDES_RESET")
 
     def reset_for_new_day(self) -> None:
@@ -279,18 +457,18 @@ class NidiaState:
         self._logger.info("STATE_RESET_NEW_DAY")
 
     def to_dict(self) -> dict[str, Any]:
-        """Export full state as dictionary."""
+        """Export full state as dictionary (built as a single literal)."""
         return {
             "battery_capacity_kwh": self.battery_capacity_kwh,
             "current_soc": self.current_soc,
             "is_charging_active": self.is_charging_active,
+            "last_run_summary": self.last_run_summary,
+            "last_run_charged_kwh": self.last_run_charged_kwh,
+            "is_in_charging_window": self.is_in_charging_window,
             "current_plan": self.current_plan.to_dict(),
             "current_session": self.current_session.to_dict(),
             "ev": self.ev.to_dict(),
             "savings": self.savings.to_dict(),
-            "last_run_summary": self.last_run_summary,
-            "last_run_charged_kwh": self.last_run_charged_kwh,
-            "is_in_charging_window": self.is_in_charging_window,
             "window_start": f"{self.window_start_hour:02d}:{self.window_start_minute:02d}",
             "window_end": f"{self.window_end_hour:02d}:{self.window_end_minute:02d}",
         }
@@ -336,3 +514,17 @@ class NidiaState:
     def ev_energy_kwh(self) -> float:
         """Get EV energy."""
         return self.ev.energy_kwh
+
+
+# Fields that make up window_start_time / window_end_time
+_WINDOW_FIELDS = frozenset({
+    "window_start_hour",
+    "window_start_minute",
+    "window_end_hour",
+    "window_end_minute",
+})
+
+# Public fields plus the override properties that have setters
+NidiaState._FIELDS = frozenset(
+    f.name for f in fields(NidiaState) if not f.name.startswith("_")
+) | {"force_charge_enabled", "disable_charge_enabled"}
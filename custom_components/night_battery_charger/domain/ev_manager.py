@@ -6,10 +6,13 @@ All hardware interactions are delegated to the coordinator.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime, time, timedelta
+import math
+from datetime import datetime, time
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+if TYPE_CHECKING:
+    from .planner import EnergyBalance
 
 
 class EVSetResult(str, Enum):
@@ -20,9 +23,15 @@ class EVSetResult(str, Enum):
     RESET = "reset"  # EV reset to 0
 
 
-@dataclass
-class EVDecision:
-    """Decision made by EV manager."""
+# Members bound once at module level so evaluate() avoids the Enum class
+# attribute lookup. They are still EVSetResult members for callers.
+RESULT_PROCESSED: Final = EVSetResult.PROCESSED
+RESULT_SAVED: Final = EVSetResult.SAVED
+RESULT_RESET: Final = EVSetResult.RESET
+
+
+class EVDecision(NamedTuple):
+    """Decision made by EV manager (immutable, built once per evaluate())."""
 
     result: EVSetResult
     reason: str
@@ -33,7 +42,7 @@ class EVDecision:
     bypass_reason: str = ""
 
     # Energy balance
-    energy_balance: dict | None = None
+    energy_balance: EnergyBalance | None = None
 
     # Additional info
     is_timeout: bool = False
@@ -42,6 +51,232 @@ class EVDecision:
 # Default Constants (can be overridden via config)
 DEFAULT_EV_CHARGE_TIMEOUT_HOURS = 6
 BYPASS_SAFETY_MARGIN = 1.15
+DEFAULT_WINDOW_START = time(0, 0)
+DEFAULT_WINDOW_END = time(7, 0)
+
+# Bypass decision codes and their (should_activate, reason) pairs
+BYPASS_TIMEOUT = 0
+BYPASS_EV_CHARGING = 1
+BYPASS_NO_EV_CHARGING = 2
+_BYPASS_TABLE: Final = (
+    (False, "timeout"),
+    (True, "ev_charging_active"),
+    (False, "no_ev_charging"),
+)
+
+
+def _validate_value(value: float, max_value: float = 200.0) -> float:
+    """Validate and clamp EV energy value.
+
+    Args:
+        value: Raw input value
+        max_value: Maximum allowed value (configurable)
+
+    Returns:
+        Clamped value between 0.0 and max_value
+    """
+    # Handle NaN and infinite values
+    if not math.isfinite(value):
+        return 0.0
+    return max(0.0, min(max_value, value))
+
+
+def _is_in_charging_window(
+    current_time: time,
+    window_start: time | None = None,
+    window_end: time | None = None,
+) -> bool:
+    """Check if current time is within charging window.
+
+    Args:
+        current_time: Time to check
+        window_start: Window start time (default 00:00)
+        window_end: Window end time (default 07:00)
+
+    Returns:
+        True if within window
+    """
+    if window_start is None:
+        window_start = DEFAULT_WINDOW_START
+    if window_end is None:
+        window_end = DEFAULT_WINDOW_END
+
+    return window_start <= current_time < window_end
+
+
+def _is_timeout_reached(
+    timer_start: datetime | None,
+    now: datetime,
+    timeout_hours: float = DEFAULT_EV_CHARGE_TIMEOUT_HOURS,
+) -> bool:
+    """Check if EV charge timeout has been reached.
+
+    Args:
+        timer_start: When timer was started
+        now: Current datetime
+        timeout_hours: Timeout in hours (configurable)
+
+    Returns:
+        True if timeout reached
+    """
+    if timer_start is None:
+        return False
+    return (now - timer_start).total_seconds() >= timeout_hours * 3600.0
+
+
+def _get_elapsed_hours(timer_start: datetime | None, now: datetime) -> float:
+    """Get elapsed hours since timer start.
+
+    Args:
+        timer_start: When timer was started
+        now: Current datetime
+
+    Returns:
+        Elapsed hours, or 0 if no timer
+    """
+    if timer_start is None:
+        return 0.0
+    elapsed = now - timer_start
+    return elapsed.total_seconds() / 3600.0
+
+
+def _should_activate_bypass(
+    energy_balance: EnergyBalance,
+    is_timeout: bool = False,
+    ev_energy_kwh: float = 0.0,
+) -> tuple[bool, str]:
+    """Decide whether bypass should be activated.
+
+    Bypass is ALWAYS activated when EV is charging to ensure the EV
+    draws power from the grid instead of depleting the battery.
+
+    Args:
+        energy_balance: Energy balance from ChargePlanner.calculate_energy_balance()
+        is_timeout: Whether timeout has been reached
+        ev_energy_kwh: EV energy being charged
+
+    Returns:
+        Tuple of (should_activate, reason)
+    """
+    return _BYPASS_TABLE[_bypass_code(is_timeout, ev_energy_kwh)]
+
+
+def _bypass_code(is_timeout: bool, ev_energy_kwh: float) -> int:
+    """Get the bypass decision as one of the BYPASS_* codes."""
+    if is_timeout:
+        return BYPASS_TIMEOUT
+
+    # Always activate bypass when EV is charging (ev_energy > 0)
+    if ev_energy_kwh > 0:
+        return BYPASS_EV_CHARGING
+
+    return BYPASS_NO_EV_CHARGING
+
+
+def _evaluate(
+    new_value: float,
+    old_value: float,
+    current_time: time,
+    now: datetime,
+    timer_start: datetime | None,
+    energy_balance: EnergyBalance,
+    timeout_hours: float = DEFAULT_EV_CHARGE_TIMEOUT_HOURS,
+    window_start: time | None = None,
+    window_end: time | None = None,
+    max_ev_value: float = 200.0,
+) -> EVDecision:
+    """Evaluate EV energy change and make decision.
+
+    This is the main entry point for EV logic.
+
+    Args:
+        new_value: New EV energy value
+        old_value: Old EV energy value
+        current_time: Current time (for window check)
+        now: Current datetime (for timeout check)
+        timer_start: Timer start time (if active)
+        energy_balance: Energy balance from ChargePlanner.calculate_energy_balance()
+        timeout_hours: EV timeout in hours (configurable)
+        window_start: Charging window start time (configurable)
+        window_end: Charging window end time (configurable)
+        max_ev_value: Maximum EV energy value (configurable)
+
+    Returns:
+        EVDecision with all decision info
+    """
+    # Validate - values already in range (the usual case) skip the clamp,
+    # NaN fails the range check and takes the full validation path
+    if 0.0 <= new_value <= max_ev_value:
+        value = new_value
+    else:
+        value = _validate_value(new_value, max_ev_value)
+
+    # Check window (inlined _is_in_charging_window)
+    if window_start is None:
+        window_start = DEFAULT_WINDOW_START
+    if window_end is None:
+        window_end = DEFAULT_WINDOW_END
+
+    if not window_start <= current_time < window_end:
+        # Outside window - just save for later
+        return EVDecision(
+            result=RESULT_SAVED,
+            reason="outside_charging_window",
+            value=value,
+            bypass_should_activate=False,
+            bypass_reason="outside_window",
+        )
+
+    # In window - check for reset
+    if value == 0:
+        return EVDecision(
+            result=RESULT_RESET,
+            reason="ev_set_to_zero",
+            value=0,
+            bypass_should_activate=False,
+            bypass_reason="ev_reset",
+        )
+
+    # Check timeout
+    is_timeout = _is_timeout_reached(timer_start, now, timeout_hours)
+
+    # Decide bypass - always activate when EV is charging
+    bypass_activate, bypass_reason = _BYPASS_TABLE[_bypass_code(is_timeout, value)]
+
+    return EVDecision(
+        result=RESULT_PROCESSED,
+        reason="in_charging_window",
+        value=value,
+        bypass_should_activate=bypass_activate,
+        bypass_reason=bypass_reason,
+        energy_balance=energy_balance,
+        is_timeout=is_timeout,
+    )
+
+
+def _get_remaining_timeout_minutes(
+    timer_start: datetime | None,
+    now: datetime,
+    timeout_hours: float = DEFAULT_EV_CHARGE_TIMEOUT_HOURS,
+) -> int:
+    """Get remaining minutes before timeout.
+
+    Args:
+        timer_start: Timer start time
+        now: Current datetime
+        timeout_hours: Timeout in hours (configurable)
+
+    Returns:
+        Remaining minutes, or 0 if expired/no timer
+    """
+    if timer_start is None:
+        return 0
+
+    remaining_s = timeout_hours * 3600.0 - (now - timer_start).total_seconds()
+    if remaining_s <= 0:
+        return 0
+
+    return int(remaining_s / 60)
 
 
 class EVManager:
@@ -58,215 +293,15 @@ class EVManager:
     - Access HA directly
     - Control switches
     - Send notifications
-    """
 
-    @staticmethod
-    def validate_value(value: float, max_value: float = 200.0) -> float:
-        """Validate and clamp EV energy value.
-
-        Args:
-            value: Raw input value
-            max_value: Maximum allowed value (configurable)
-
-        Returns:
-            Clamped value between 0.0 and max_value
-        """
-        import math
-        # Handle NaN and infinite values
-        if not math.isfinite(value):
-            return 0.0
-        return max(0.0, min(max_value, value))
-
-    @staticmethod
-    def is_in_charging_window(
-        current_time: time,
-        window_start: time | None = None,
-        window_end: time | None = None,
-    ) -> bool:
-        """Check if current time is within charging window.
-
-        Args:
-            current_time: Time to check
-            window_start: Window start time (default 00:00)
-            window_end: Window end time (default 07:00)
-
-        Returns:
-            True if within window
-        """
-        if window_start is None:
-            window_start = time(0, 0)
-        if window_end is None:
-            window_end = time(7, 0)
-
-        return window_start <= current_time < window_end
-
-    @staticmethod
-    def is_timeout_reached(
-        timer_start: datetime | None,
-        now: datetime,
-        timeout_hours: float = DEFAULT_EV_CHARGE_TIMEOUT_HOURS,
-    ) -> bool:
-        """Check if EV charge timeout has been reached.
-
-        Args:
-            timer_start: When timer was started
-            now: Current datetime
-            timeout_hours: Timeout in hours (configurable)
-
-        Returns:
-            True if timeout reached
-        """
-        if timer_start is None:
-            return False
-        elapsed = now - timer_start
-        return elapsed >= timedelta(hours=timeout_hours)
-
-    @staticmethod
-    def get_elapsed_hours(timer_start: datetime | None, now: datetime) -> float:
-        """Get elapsed hours since timer start.
-
-        Args:
-            timer_start: When timer was started
-            now: Current datetime
-
-        Returns:
-            Elapsed hours, or 0 if no timer
-        """
-        if timer_start is None:
-            return 0.0
-        elapsed = now - timer_start
-        return elapsed.total_seconds() / 3600.0
-
-    @staticmethod
-    def should_activate_bypass(
-        energy_balance: dict,
-        is_timeout: bool = False,
-        ev_energy_kwh: float = 0.0,
-    ) -> tuple[bool, str]:
-        """Decide whether bypass should be activated.
-
-        Bypass is ALWAYS activated when EV is charging to ensure the EV
-        draws power from the grid instead of depleting the battery.
-
-        Args:
-            energy_balance: Energy balance from ChargePlanner.calculate_energy_balance()
-            is_timeout: Whether timeout has been reached
-            ev_energy_kwh: EV energy being charged
-
-        Returns:
-            Tuple of (should_activate, reason)
-        """
-        if is_timeout:
-            return False, "timeout"
-
-        # Always activate bypass when EV is charging (ev_energy > 0)
-        if ev_energy_kwh > 0:
-            return True, "ev_charging_active"
-
-        return False, "no_ev_charging"
-
-    @staticmethod
-    def evaluate(
-        new_value: float,
-        old_value: float,
-        current_time: time,
-        now: datetime,
-        timer_start: datetime | None,
-        energy_balance: dict,
-        timeout_hours: float = DEFAULT_EV_CHARGE_TIMEOUT_HOURS,
-        window_start: time | None = None,
-        window_end: time | None = None,
-        max_ev_value: float = 200.0,
-    ) -> EVDecision:
-        """Evaluate EV energy change and make decision.
-
-        This is the main entry point for EV logic.
-
-        Args:
-            new_value: New EV energy value
-            old_value: Old EV energy value
-            current_time: Current time (for window check)
-            now: Current datetime (for timeout check)
-            timer_start: Timer start time (if active)
-            energy_balance: Energy balance dict
-            timeout_hours: EV timeout in hours (configurable)
-            window_start: Charging window start time (configurable)
-            window_end: Charging window end time (configurable)
-            max_ev_value: Maximum EV energy value (configurable)
-
-        Returns:
-            EVDecision with all decision info
-        """
-        # Validate
-        value = EVManager.validate_value(new_value, max_ev_value)
-
-        # Check window
-        in_window = EVManager.is_in_charging_window(
-            current_time, window_start, window_end
-        )
-
-        if not in_window:
-            # Outside window - just save for later
-            return EVDecision(
-                result=EVSetResult.SAVED,
-                reason="outside_charging_window",
-                value=value,
-                bypass_should_activate=False,
-                bypass_reason="outside_window",
-            )
-
-        # In window - check for reset
-        if value == 0:
-            return EVDecision(
-                result=EVSetResult.RESET,
-                reason="ev_set_to_zero",
-                value=0,
-                bypass_should_activate=False,
-                bypass_reason="ev_reset",
-            )
-
-        # Check timeout
-        is_timeout = EVManager.is_timeout_reached(timer_start, now, timeout_hours)
-
-        # Decide bypass - always activate when EV is charging
-        bypass_activate, bypass_reason = EVManager.should_activate_bypass(
-            energy_balance, is_timeout, ev_energy_kwh=value
-        )
-
-        return EVDecision(
-            result=EVSetResult.PROCESSED,
-            reason="in_charging_window",
-            value=value,
-            bypass_should_activate=bypass_activate,
-            bypass_reason=bypass_reason,
-            energy_balance=energy_balance,
-            is_timeout=is_timeout,
-        )
+    The logic lives in module-level functions; this class only groups
+    them under their historical names.
+    """
 
-    @staticmethod
-    def get_remaining_timeout_minutes(
-        timer_start: datetime | None,
-        now: datetime,
-        timeout_hours: float = DEFAULT_EV_CHARGE_TIMEOUT_HOURS,
-    ) -> int:
-        """Get remaining minutes before timeout.
-
-        Args:
-            timer_start: Timer start time
-            now: Current datetime
-            timeout_hours: Timeout in hours (configurable)
-
-        Returns:
-            Remaining minutes, or 0 if expired/no timer
-        """
-        if timer_start is None:
-            return 0
-
-        elapsed = now - timer_start
-        timeout_delta = timedelta(hours=timeout_hours)
-        remaining = timeout_delta - elapsed
-
-        if remaining.total_seconds() <= 0:
-            return 0
-
-        return int(remaining.total_seconds() / 60)
+    validate_value = staticmethod(_validate_value)
+    is_in_charging_window = staticmethod(_is_in_charging_window)
+    is_timeout_reached = staticmethod(_is_timeout_reached)
+    get_elapsed_hours = staticmethod(_get_elapsed_hours)
+    should_activate_bypass = staticmethod(_should_activate_bypass)
+    evaluate = staticmethod(_evaluate)
+    get_remaining_timeout_minutes = staticmethod(_get_remaining_timeout_minutes)
@@ -9,21 +9,29 @@ This module contains:
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
+from math import isfinite
 from datetime import datetime, timedelta
 from typing import Any
 
+from homeassistant.util import dt as dt_util
+
 
 # Number of days to keep in history
 HISTORY_DAYS = 21
 
+# Seconds -> hours for the power integration
+_INV_3600 = 1.0 / 3600.0
+
 WEEKDAY_NAMES = [
     "monday", "tuesday", "wednesday", "thursday",
     "friday", "saturday", "sunday"
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsumptionRecord:
     """Daily consumption record."""
 
@@ -32,7 +40,7 @@ class ConsumptionRecord:
     consumption_kwh: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ForecastResult:
     """Forecast result."""
 
@@ -57,59 +65,60 @@ class ConsumptionForecaster:
         Args:
             history: Optional historical data to load
         """
-        self._history: list[dict] = history or []
+        # Bounded FIFO, oldest date first: day closes arrive in date order so
+        # the deque evicts the oldest record itself
+        self._history: deque[dict] = deque(
+            sorted(history or [], key=lambda x: x.get("date", "")), maxlen=HISTORY_DAYS
+        )
         self._current_day_kwh: float = 0.0
-        self._last_reading_time: datetime | None = None
+        self._last_reading_ts: float | None = None  # epoch seconds
         self._last_reading_value: float | None = None
 
-        # Cache for weekday averages
-        self._weekday_cache: dict[int, float] | None = None
-        self._cache_valid: bool = False
+        # Running consumption sums/counts per weekday (0=Monday), kept in
+        # step with every history change
+        self._wd_sum: list[float] = [0.0] * 7
+        self._wd_count: list[int] = [0] * 7
+        self._wd_avg: list[float] = [0.0] * 7
+        self._rebuild_weekday_sums()
 
-    def add_power_reading(self, power_watts: float, now: datetime) -> float:
+    def add_power_reading(self, power_watts: float, now: datetime | float) -> float:
         """Add a power reading and update daily consumption.
 
         Uses trapezoidal integration: energy = (P1 + P2) / 2 * dt
 
         Args:
             power_watts: Current power reading in Watts
-            now: Current timestamp
+            now: Current timestamp (datetime or epoch seconds)
 
         Returns:
             Updated current day consumption in kWh
         """
-        import math
+        now_ts = now.timestamp() if isinstance(now, datetime) else now
 
         # Validate power reading
-        if not math.isfinite(power_watts):
+        if not isfinite(power_watts):
             return self._current_day_kwh
 
         # Clamp to reasonable range (0 to 100kW)
-        power_watts = max(0.0, min(100000.0, power_watts))
-
-        if self._last_reading_time is None:
-            # First reading - just record it
-            self._last_reading_time = now
-            self._last_reading_value = power_watts
-            return self._current_day_kwh
-
-        # Calculate time difference in hours
-        time_diff_hours = (now - self._last_reading_time).total_seconds() / 3600.0
-
-        # Skip if time difference is too large (> 1 hour) or negative
-        if time_diff_hours <= 0 or time_diff_hours > 1.0:
-            self._last_reading_time = now
-            self._last_reading_value = power_watts
-            return self._current_day_kwh
-
-        # Trapezoidal integration: average power * time
-        avg_power = (self._last_reading_value + power_watts) / 2.0
-        energy_kwh = (avg_power * time_diff_hours) / 1000.0
-
-        self._current_day_kwh += energy_kwh
+        if power_watts < 0.0:
+            power_watts = 0.0
+        elif power_watts > 100000.0:
+            power_watts = 100000.0
+
+        # The first reading is only recorded
+        if self._last_reading_ts is not None:
+            # Calculate time difference in hours
+            time_diff_hours = (now_ts - self._last_reading_ts) * _INV_3600
+
+            # Trapezoidal integration: average power * time. Gaps that are
+            # too large (> 1 hour) or negative add nothing, the reading only
+            # restarts the integration.
+            if 0.0 < time_diff_hours <= 1.0:
+                avg_power = (self._last_reading_value + power_watts) * 0.5
+                self._current_day_kwh += avg_power * time_diff_hours * 0.001
 
         # Update for next reading
-        self._last_reading_time = now
+        self._last_reading_ts = now_ts
         self._last_reading_value = power_watts
 
         return self._current_day_kwh
@@ -120,6 +129,9 @@ class ConsumptionForecaster:
         Args:
             now: Current timestamp (should be midnight)
 
+        Days without any power reading (e.g. sensor unavailable all day) are
+        not added to history, so they don't drag the weekday average down.
+
         Returns:
             ConsumptionRecord with the day's data
         """
@@ -134,6 +146,13 @@ class ConsumptionForecaster:
             consumption_kwh=self._current_day_kwh,
         )
 
+        if self._last_reading_ts is None and self._current_day_kwh == 0.0:
+            return record
+
+        # The append below drops the oldest record when full
+        if len(self._history) == HISTORY_DAYS:
+            self._remove_from_weekday_sums(self._history[0])
+
         # Add to history
         self._history.append({
             "date": record.date,
@@ -141,49 +160,47 @@ class ConsumptionForecaster:
             "consumption_kwh": record.consumption_kwh,
         })
 
-        # Prune old history
-        if len(self._history) > HISTORY_DAYS:
-            self._history.sort(key=lambda x: x["date"])
-            self._history = self._history[-HISTORY_DAYS:]
-
-        # Invalidate cache
-        self._invalidate_cache()
+        self._wd_sum[weekday] += record.consumption_kwh
+        self._wd_count[weekday] += 1
+        self._wd_avg[weekday] = self._wd_sum[weekday] / self._wd_count[weekday]
 
         # Reset for new day
         self._current_day_kwh = 0.0
-        self._last_reading_time = None
+        self._last_reading_ts = None
         self._last_reading_value = None
 
         return record
 
-    def _invalidate_cache(self) -> None:
-        """Invalidate the weekday averages cache."""
-        self._weekday_cache = None
-        self._cache_valid = False
-
-    def _ensure_cache(self) -> None:
-        """Ensure cache is populated."""
-        if self._cache_valid and self._weekday_cache is not None:
-            return
-
-        self._weekday_cache = {}
-        for weekday in range(7):
-            values = [
-                entry["consumption_kwh"]
-                for entry in self._history
-                if entry["weekday"] == weekday
-            ]
-            if values:
-                self._weekday_cache[weekday] = sum(values) / len(values)
-            else:
-                self._weekday_cache[weekday] = 0.0
+    def _rebuild_weekday_sums(self) -> None:
+        """Recompute the weekday sums/counts from the full history."""
+        sums = [0.0] * 7
+        counts = [0] * 7
+        for entry in self._history:
+            weekday = entry["weekday"]
+            sums[weekday] += entry["consumption_kwh"]
+            counts[weekday] += 1
+        self._wd_sum = sums
+        self._wd_count = counts
+        self._wd_avg = [
+            total / count if count else 0.0 for total, count in zip(sums, counts)
+        ]
 
-        self._cache_valid = True
+    def _remove_from_weekday_sums(self, entry: dict) -> None:
+        """Take a dropped history entry out of the weekday sums."""
+        weekday = entry["weekday"]
+        self._wd_count[weekday] -= 1
+        if self._wd_count[weekday]:
+            self._wd_sum[weekday] -= entry["consumption_kwh"]
+            self._wd_avg[weekday] = self._wd_sum[weekday] / self._wd_count[weekday]
+        else:
+            # Avoid carrying float residue into an empty weekday
+            self._wd_sum[weekday] = 0.0
+            self._wd_avg[weekday] = 0.0
 
     def get_weekday_average(self, weekday: int) -> float:
         """Get average consumption for a specific weekday.
 
-        Uses cached values for performance.
+        Averages are updated together with the running weekday sums.
 
         Args:
             weekday: Day of week (0=Monday, 6=Sunday)
@@ -191,22 +208,24 @@ class ConsumptionForecaster:
         Returns:
             Average consumption in kWh, or 0 if no data
         """
-        self._ensure_cache()
-        return self._weekday_cache.get(weekday, 0.0)
+        if not 0 <= weekday < 7:
+            return 0.0
+        return self._wd_avg[weekday]
 
     def get_all_weekday_averages(self) -> dict[str, float]:
         """Get averages for all weekdays.
 
-        Uses cached values for performance.
+        Averages are updated together with the running weekday sums.
 
         Returns:
             Dictionary mapping weekday names to average consumption
         """
-        self._ensure_cache()
-        return {
-            name: self._weekday_cache.get(i, 0.0)
-            for i, name in enumerate(WEEKDAY_NAMES)
-        }
+        return dict(zip(WEEKDAY_NAMES, self._wd_avg))
+
+    @property
+    def weekday_averages(self) -> tuple[float, ...]:
+        """Get the averages indexed by weekday (0=Monday)."""
+        return tuple(self._wd_avg)
 
     def get_consumption_forecast(
         self,
@@ -227,12 +246,10 @@ class ConsumptionForecaster:
         if now is None:
             now = datetime.now()
 
+        # Tomorrow's weekday without building a shifted datetime
+        weekday = now.weekday()
         if for_tomorrow:
-            target_date = now + timedelta(days=1)
-        else:
-            target_date = now
-
-        weekday = target_date.weekday()
+            weekday = (weekday + 1) % 7
         consumption = self.get_weekday_average(weekday)
 
         # Apply minimum fallback
@@ -244,7 +261,7 @@ class ConsumptionForecaster:
     def reset_current_day(self) -> None:
         """Reset current day tracking."""
         self._current_day_kwh = 0.0
-        self._last_reading_time = None
+        self._last_reading_ts = None
         self._last_reading_value = None
 
     def delete_record(self, date_str: str) -> bool:
@@ -256,14 +273,15 @@ class ConsumptionForecaster:
         Returns:
             True if record was found and deleted, False otherwise
         """
-        original_count = len(self._history)
-        self._history = [
-            record for record in self._history
-            if record.get("date") != date_str
-        ]
+        kept = []
+        for record in self._history:
+            if record.get("date") == date_str:
+                self._remove_from_weekday_sums(record)
+            else:
+                kept.append(record)
 
-        if len(self._history) < original_count:
-            self._invalidate_cache()
+        if len(kept) < len(self._history):
+            self._history = deque(kept, maxlen=HISTORY_DAYS)
             return True
         return False
 
@@ -281,10 +299,35 @@ class ConsumptionForecaster:
         """Get current day consumption so far."""
         return self._current_day_kwh
 
+    @property
+    def tracking_active(self) -> bool:
+        """Check if a power reading was recorded for the current day."""
+        return self._last_reading_ts is not None
+
+    @property
+    def last_reading_time(self) -> datetime | None:
+        """Get the time of the last power reading (HA timezone)."""
+        if self._last_reading_ts is None:
+            return None
+        return dt_util.as_local(dt_util.utc_from_timestamp(self._last_reading_ts))
+
+    @property
+    def last_reading_value(self) -> float | None:
+        """Get the last power reading in Watts."""
+        return self._last_reading_value
+
     @property
     def history(self) -> list[dict]:
-        """Get history data."""
-        return self._history
+        """Get history data (oldest first)."""
+        return list(self._history)
+
+    def recent_history(self, count: int = 7) -> list[dict]:
+        """Get the most recent records, newest first.
+
+        History is kept in date order, so this reads the tail of the deque
+        instead of sorting the full history.
+        """
+        return list(islice(reversed(self._history), count))
 
     @property
     def history_count(self) -> int:
@@ -294,7 +337,7 @@ class ConsumptionForecaster:
     def to_dict(self) -> dict[str, Any]:
         """Export data for storage."""
         return {
-            "history": self._history,
+            "history": list(self._history),
         }
 
     @classmethod
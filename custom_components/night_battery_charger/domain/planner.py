@@ -12,15 +12,16 @@ This makes it:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
 
 if TYPE_CHECKING:
     from ..core.state import ChargePlan
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlanningInput:
-    """Input data for plan calculation."""
+    """Input data for plan calculation (hashable, used as the cache key)."""
 
     # Battery state
     current_soc_percent: float
@@ -45,9 +46,9 @@ class PlanningInput:
     is_preview: bool = False  # True = calculating for tomorrow
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PlanningResult:
-    """Result of plan calculation."""
+    """Result of plan calculation (shared between identical inputs)."""
 
     target_soc_percent: float
     planned_charge_kwh: float
@@ -63,6 +64,21 @@ class PlanningResult:
     net_load_on_battery_kwh: float
 
 
+class EnergyBalance(NamedTuple):
+    """Energy balance for the bypass decision (all values in kWh)."""
+
+    battery_kwh: float
+    solar_kwh: float
+    consumption_kwh: float
+    ev_kwh: float
+    available: float
+    needed: float
+    needed_with_margin: float
+    sufficient: bool
+    deficit: float
+    surplus: float
+
+
 class ChargePlanner:
     """Pure charge planning logic.
 
@@ -71,9 +87,13 @@ class ChargePlanner:
     """
 
     @staticmethod
+    @lru_cache(maxsize=8)
     def calculate(input_data: PlanningInput) -> PlanningResult:
         """Calculate optimal charging plan.
 
+        Results are memoized per input, so unchanged inputs between
+        recalculations skip the arithmetic and reasoning formatting.
+
         Algorithm:
         1. Calculate current battery energy
         2. Calculate reserve energy (minimum to keep)
@@ -90,11 +110,15 @@ class ChargePlanner:
         Returns:
             PlanningResult with calculated plan
         """
+        capacity = input_data.battery_capacity_kwh
+        # kWh per SOC percent, shared by all percent -> energy conversions
+        soc_to_energy = capacity * 0.01
+
         # Step 1: Calculate current battery energy
-        current_energy = (input_data.current_soc_percent / 100.0) * input_data.battery_capacity_kwh
+        current_energy = input_data.current_soc_percent * soc_to_energy
 
         # Step 2: Calculate reserve energy
-        reserve_energy = (input_data.min_soc_reserve_percent / 100.0) * input_data.battery_capacity_kwh
+        reserve_energy = input_data.min_soc_reserve_percent * soc_to_energy
 
         # Step 3: Calculate total load
         total_load = input_data.consumption_forecast_kwh + input_data.ev_energy_kwh
@@ -106,17 +130,17 @@ class ChargePlanner:
         base_target = reserve_energy + max(0, net_load_on_battery)
 
         # Step 6: Apply safety spread
-        target_with_safety = base_target * (1.0 + input_data.safety_spread_percent / 100.0)
+        target_with_safety = base_target * (1.0 + input_data.safety_spread_percent * 0.01)
 
         # Step 7: Clamp to valid range and convert to SOC
         target_soc_percent = min(
             100.0,
             max(
                 input_data.min_soc_reserve_percent,
-                (target_with_safety / input_data.battery_capacity_kwh) * 100.0
+                target_with_safety / capacity * 100.0
             )
         )
-        target_energy = (target_soc_percent / 100.0) * input_data.battery_capacity_kwh
+        target_energy = target_soc_percent * soc_to_energy
 
         # Step 8: Calculate charge needed
         needed_kwh = max(0, target_energy - current_energy)
@@ -138,20 +162,21 @@ class ChargePlanner:
             # User forced full charge
             reasoning_prefix = "[FORCED BY USER] "
             target_soc_percent = 100.0
-            target_energy = input_data.battery_capacity_kwh
+            target_energy = capacity
             planned_charge_kwh = max(0, target_energy - current_energy)
             is_charging_scheduled = True
 
         # Build reasoning string
         day_prefix = "Tomorrow's" if input_data.is_preview else "Today's"
+        ev_part = (
+            f" + {input_data.ev_energy_kwh:.2f} kWh EV"
+            if input_data.ev_energy_kwh > 0
+            else ""
+        )
         reasoning = (
             f"{reasoning_prefix}Planned {planned_charge_kwh:.2f} kWh grid charge. "
             f"{day_prefix} estimated load is {input_data.consumption_forecast_kwh:.2f} kWh"
-        )
-        if input_data.ev_energy_kwh > 0:
-            reasoning += f" + {input_data.ev_energy_kwh:.2f} kWh EV"
-        reasoning += (
-            f", with {input_data.solar_forecast_kwh:.2f} kWh solar forecast. "
+            f"{ev_part}, with {input_data.solar_forecast_kwh:.2f} kWh solar forecast. "
             f"Target SOC: {target_soc_percent:.1f}%."
         )
 
@@ -175,7 +200,7 @@ class ChargePlanner:
         consumption_forecast_kwh: float,
         ev_energy_kwh: float,
         safety_margin: float = 1.15,
-    ) -> dict:
+    ) -> EnergyBalance:
         """Calculate energy balance for bypass decision.
 
         Args:
@@ -186,22 +211,22 @@ class ChargePlanner:
             safety_margin: Safety margin multiplier (default 15%)
 
         Returns:
-            Dictionary with energy balance info
+            EnergyBalance with the energy balance info
         """
         available = battery_energy_kwh + solar_forecast_kwh
         needed = consumption_forecast_kwh + ev_energy_kwh
         needed_with_margin = needed * safety_margin
         sufficient = available >= needed_with_margin
 
-        return {
-            "battery_kwh": battery_energy_kwh,
-            "solar_kwh": solar_forecast_kwh,
-            "consumption_kwh": consumption_forecast_kwh,
-            "ev_kwh": ev_energy_kwh,
-            "available": available,
-            "needed": needed,
-            "needed_with_margin": needed_with_margin,
-            "sufficient": sufficient,
-            "deficit": max(0, needed_with_margin - available),
-            "surplus": max(0, available - needed_with_margin),
-        }
+        return EnergyBalance(
+            battery_kwh=battery_energy_kwh,
+            solar_kwh=solar_forecast_kwh,
+            consumption_kwh=consumption_forecast_kwh,
+            ev_kwh=ev_energy_kwh,
+            available=available,
+            needed=needed,
+            needed_with_margin=needed_with_margin,
+            sufficient=sufficient,
+            deficit=max(0, needed_with_margin - available),
+            surplus=max(0, available - needed_with_margin),
+        )
@@ -16,12 +16,26 @@ Or simpler two-tier pricing:
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta
+from operator import itemgetter
 from typing import Any
 
+_RECORD_DATE = itemgetter("date")
 
-@dataclass
+
+def _parse_month(month_str: str | None) -> tuple[int, int]:
+    """Parse a stored "YYYY-MM" string, (0, 0) when missing or invalid."""
+    try:
+        year, month = month_str.split("-", 1)
+        return int(year), int(month)
+    except (AttributeError, ValueError):
+        return (0, 0)
+
+
+@dataclass(slots=True)
 class SavingsRecord:
     """Record of savings for a single charge session."""
 
@@ -32,17 +46,17 @@ class SavingsRecord:
     savings: float  # Difference (peak - offpeak)
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary."""
+        """Convert to dictionary (costs rounded to cents)."""
         return {
             "date": self.date,
             "charged_kwh": self.charged_kwh,
-            "offpeak_cost": self.offpeak_cost,
-            "peak_cost": self.peak_cost,
-            "savings": self.savings,
+            "offpeak_cost": round(self.offpeak_cost, 2),
+            "peak_cost": round(self.peak_cost, 2),
+            "savings": round(self.savings, 2),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SavingsState:
     """Accumulated savings state."""
 
@@ -55,7 +69,7 @@ class SavingsState:
     # Monthly stats
     monthly_charged_kwh: float = 0.0
     monthly_savings_eur: float = 0.0
-    current_month: str = ""
+    current_year_month: tuple[int, int] = (0, 0)  # (0, 0) = no session yet
 
     # Lifetime stats
     lifetime_charged_kwh: float = 0.0
@@ -64,6 +78,50 @@ class SavingsState:
     # Session history (last 30 days)
     history: list[dict] = field(default_factory=list)
 
+    # Records per history date, kept in step by add_history/prune_history
+    _day_counts: Counter[str] = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Count the loaded history records per date."""
+        self._day_counts.update(map(_RECORD_DATE, self.history))
+
+    @property
+    def current_month(self) -> str:
+        """Get the current month as "YYYY-MM" ("" before the first session)."""
+        year, month = self.current_year_month
+        if not year:
+            return ""
+        return f"{year:04d}-{month:02d}"
+
+    @property
+    def history_days(self) -> int:
+        """Get the number of distinct dates in the history."""
+        return len(self._day_counts)
+
+    def add_history(self, entry: dict) -> None:
+        """Append a record to the history."""
+        self.history.append(entry)
+        self._day_counts[entry["date"]] += 1
+
+    def prune_history(self, cutoff: str) -> None:
+        """Drop records dated before cutoff (ISO date).
+
+        Records are appended in date order, so everything before the cutoff
+        is a leading slice.
+        """
+        stale = bisect_left(self.history, cutoff, key=_RECORD_DATE)
+        if not stale:
+            return
+        day_counts = self._day_counts
+        for entry in self.history[:stale]:
+            day = entry["date"]
+            day_counts[day] -= 1
+            if not day_counts[day]:
+                del day_counts[day]
+        del self.history[:stale]
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage."""
         return {
@@ -89,7 +147,7 @@ class SavingsState:
             theoretical_cost_eur=data.get("theoretical_cost_eur", 0.0),
             monthly_charged_kwh=data.get("monthly_charged_kwh", 0.0),
             monthly_savings_eur=data.get("monthly_savings_eur", 0.0),
-            current_month=data.get("current_month", ""),
+            current_year_month=_parse_month(data.get("current_month")),
             lifetime_charged_kwh=data.get("lifetime_charged_kwh", 0.0),
             lifetime_savings_eur=data.get("lifetime_savings_eur", 0.0),
             history=data.get("history", []),
@@ -130,6 +188,7 @@ class SavingsCalculator:
         self.price_f2 = price_f2
         self.price_f3 = price_f3
         self.pricing_mode = pricing_mode
+        self._recompute_rates()
 
         self.state = SavingsState()
 
@@ -165,15 +224,30 @@ class SavingsCalculator:
         if pricing_mode is not None:
             self.pricing_mode = pricing_mode
 
+        self._recompute_rates()
+
+    def _recompute_rates(self) -> None:
+        """Derive the night/day rates from the configured prices.
+
+        Prices only change through __init__ and update_prices(), so the
+        rate getters can return these instead of recomputing them.
+        """
+        if self.pricing_mode == "three_tier":
+            self._night_rate = self.price_f3
+            # F1 is about 11 hours, F2 is about 5 hours during day
+            # Weighted average: (11*F1 + 5*F2) / 16
+            self._day_rate = (11 * self.price_f1 + 5 * self.price_f2) / 16
+        else:
+            self._night_rate = self.price_offpeak
+            self._day_rate = self.price_peak
+
     def get_night_rate(self) -> float:
         """Get the night (off-peak) rate.
 
         Returns:
             Off-peak rate in €/kWh
         """
-        if self.pricing_mode == "three_tier":
-            return self.price_f3
-        return self.price_offpeak
+        return self._night_rate
 
     def get_day_rate(self, charge_time: datetime | None = None) -> float:
         """Get the day (peak) rate.
@@ -187,11 +261,7 @@ class SavingsCalculator:
         Returns:
             Day rate in €/kWh
         """
-        if self.pricing_mode == "three_tier":
-            # F1 is about 11 hours, F2 is about 5 hours during day
-            # Weighted average: (11*F1 + 5*F2) / 16
-            return (11 * self.price_f1 + 5 * self.price_f2) / 16
-        return self.price_peak
+        return self._day_rate
 
     def record_charge_session(
         self,
@@ -211,42 +281,43 @@ class SavingsCalculator:
             charge_date = date.today()
 
         date_str = charge_date.isoformat()
-        month_str = charge_date.strftime("%Y-%m")
 
         # Calculate costs
         night_rate = self.get_night_rate()
         day_rate = self.get_day_rate()
 
+        # Totals accumulate the exact values, rounding is left to
+        # to_dict() and the sensors
         offpeak_cost = charged_kwh * night_rate
-        peak_cost = charged_kwh * day_rate
-        savings = peak_cost - offpeak_cost
+        savings = charged_kwh * (day_rate - night_rate)
+        peak_cost = offpeak_cost + savings
 
         record = SavingsRecord(
             date=date_str,
             charged_kwh=charged_kwh,
-            offpeak_cost=round(offpeak_cost, 2),
-            peak_cost=round(peak_cost, 2),
-            savings=round(savings, 2),
+            offpeak_cost=offpeak_cost,
+            peak_cost=peak_cost,
+            savings=savings,
         )
 
         # Update state
-        self._update_state(record, month_str)
+        self._update_state(record, (charge_date.year, charge_date.month))
 
         return record
 
-    def _update_state(self, record: SavingsRecord, month_str: str) -> None:
+    def _update_state(self, record: SavingsRecord, year_month: tuple[int, int]) -> None:
         """Update internal state with new record.
 
         Args:
             record: New savings record
-            month_str: Month string (YYYY-MM)
+            year_month: (year, month) of the session
         """
         # Check for month rollover
-        if self.state.current_month != month_str:
+        if self.state.current_year_month != year_month:
             # Reset monthly stats
             self.state.monthly_charged_kwh = 0.0
             self.state.monthly_savings_eur = 0.0
-            self.state.current_month = month_str
+            self.state.current_year_month = year_month
 
         # Update totals
         self.state.total_charged_kwh += record.charged_kwh
@@ -263,14 +334,10 @@ class SavingsCalculator:
         self.state.lifetime_savings_eur += record.savings
 
         # Add to history
-        self.state.history.append(record.to_dict())
+        self.state.add_history(record.to_dict())
 
         # Prune old history (keep last 30 days)
-        cutoff = (date.today() - timedelta(days=30)).isoformat()
-        self.state.history = [
-            h for h in self.state.history
-            if h["date"] >= cutoff
-        ]
+        self.state.prune_history((date.today() - timedelta(days=30)).isoformat())
 
     def get_savings_summary(self) -> dict[str, Any]:
         """Get summary of savings.
@@ -307,13 +374,12 @@ class SavingsCalculator:
         Returns:
             Average savings per day in EUR
         """
-        if not self.state.history:
+        history = self.state.history
+        if not history:
             return 0.0
 
-        total = sum(h.get("savings", 0) for h in self.state.history)
-        days = len(set(h["date"] for h in self.state.history))
-
-        return round(total / max(1, days), 2)
+        total = sum(h.get("savings", 0) for h in history)
+        return round(total / max(1, self.state.history_days), 2)
 
     def to_dict(self) -> dict[str, Any]:
         """Export for storage.
@@ -4,13 +4,15 @@ All entities are thin wrappers that:
 - Read from NidiaState
 - Delegate actions to Coordinator
 - Use factory pattern for minimal boilerplate
+
+Platform submodules are imported lazily on first attribute access, so
+loading one platform doesn't import the other four.
 """
 
-from .sensors import async_setup_sensors, SENSOR_DEFINITIONS
-from .binary_sensors import async_setup_binary_sensors
-from .numbers import async_setup_numbers
-from .switches import async_setup_switches
-from .buttons import async_setup_buttons
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
 
 __all__ = [
     "async_setup_sensors",
@@ -20,3 +22,28 @@ __all__ = [
     "async_setup_buttons",
     "SENSOR_DEFINITIONS",
 ]
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "async_setup_sensors": ".sensors",
+    "SENSOR_DEFINITIONS": ".sensors",
+    "async_setup_binary_sensors": ".binary_sensors",
+    "async_setup_numbers": ".numbers",
+    "async_setup_switches": ".switches",
+    "async_setup_buttons": ".buttons",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the exported names on first access (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazy exports alongside the module globals."""
+    return sorted(set(globals()) | set(__all__))
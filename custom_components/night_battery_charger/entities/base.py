@@ -0,0 +1,60 @@
+"""Base class for entities refreshed by the event bus."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo, Entity
+
+from ..const import DOMAIN
+
+if TYPE_CHECKING:
+    from ..core.events import NidiaEventBus
+
+
+def nidia_device_info(entry_id: str) -> DeviceInfo:
+    """Build the device info for the entities of a config entry.
+
+    The platform setup functions build it once and pass it to every entity
+    they create; HA only reads it, so the entities can share the object.
+    """
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry_id)},
+        name="Nidia Smart Battery Recharge",
+        manufacturer="Nidia",
+    )
+
+
+class NidiaEntity(Entity):
+    """Entity that refreshes itself from NidiaState on bus updates.
+
+    Registers one callback with the event bus listener list instead of a
+    dispatcher subscription per entity. Subclasses implement _handle_update.
+    """
+
+    __slots__ = ("_events",)
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(
+        self,
+        entry_id: str,
+        events: NidiaEventBus | None,
+        device_info: DeviceInfo | None = None,
+    ) -> None:
+        """Initialize the shared entity attributes."""
+        self._events = events
+        self._attr_device_info = device_info or nidia_device_info(entry_id)
+
+    async def async_added_to_hass(self) -> None:
+        """Register for updates."""
+        await super().async_added_to_hass()
+        if self._events is not None:
+            self.async_on_remove(self._events.async_add_listener(self._handle_update))
+
+    @callback
+    def _handle_update(self) -> None:
+        """Handle state update."""
+        self.async_write_ha_state()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import TYPE_CHECKING, Callable, Any
 
 from homeassistant.components.binary_sensor import (
@@ -10,19 +11,19 @@ from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
 )
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from ..core.events import NidiaEventBus
     from ..core.state import NidiaState
 
-from ..const import DOMAIN
+from .base import NidiaEntity, nidia_device_info
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BinarySensorDefinition:
     """Definition for a binary sensor."""
 
@@ -34,93 +35,91 @@ class BinarySensorDefinition:
     icon_off: str | None = None
 
 
-BINARY_SENSOR_DEFINITIONS: list[BinarySensorDefinition] = [
+BINARY_SENSOR_DEFINITIONS: tuple[BinarySensorDefinition, ...] = (
     BinarySensorDefinition(
         key="is_charging_scheduled",
         name="Charging Scheduled",
-        value_fn=lambda s: s.current_plan.is_charging_scheduled,
+        value_fn=attrgetter("current_plan.is_charging_scheduled"),
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
     ),
     BinarySensorDefinition(
         key="is_charging_active",
         name="Charging Active",
-        value_fn=lambda s: s.is_charging_active,
+        value_fn=attrgetter("is_charging_active"),
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
     ),
     BinarySensorDefinition(
         key="is_bypass_active",
         name="Bypass Active",
-        value_fn=lambda s: s.ev.bypass_active,
+        value_fn=attrgetter("ev.bypass_active"),
         icon_on="mdi:electric-switch-closed",
         icon_off="mdi:electric-switch",
     ),
     BinarySensorDefinition(
         key="is_in_charging_window",
         name="In Charging Window",
-        value_fn=lambda s: s.is_in_charging_window,
+        value_fn=attrgetter("is_in_charging_window"),
         icon_on="mdi:clock-check",
         icon_off="mdi:clock-outline",
     ),
     BinarySensorDefinition(
         key="ev_timer_active",
         name="EV Timer Active",
-        value_fn=lambda s: s.ev.is_timer_active,
+        value_fn=attrgetter("ev.is_timer_active"),
         device_class=BinarySensorDeviceClass.RUNNING,
     ),
-]
+)
 
 
-class NidiaBinarySensor(BinarySensorEntity):
+class NidiaBinarySensor(NidiaEntity, BinarySensorEntity):
     """Generic Nidia binary sensor."""
 
-    _attr_has_entity_name = True
-    _attr_should_poll = False
+    __slots__ = ("_state", "_definition", "_value_fn", "_icons")
 
     def __init__(
         self,
         entry_id: str,
         state: NidiaState,
         definition: BinarySensorDefinition,
+        events: NidiaEventBus | None = None,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize."""
+        super().__init__(entry_id, events, device_info)
         self._state = state
         self._definition = definition
+        self._value_fn = definition.value_fn
 
         self._attr_unique_id = f"{entry_id}_{definition.key}"
         self._attr_name = definition.name
         self._attr_device_class = definition.device_class
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
-
-    @property
-    def icon(self) -> str | None:
-        """Return icon based on state."""
-        if self._definition.icon_on and self._definition.icon_off:
-            return self._definition.icon_on if self.is_on else self._definition.icon_off
-        return None
+        # (off, on) icons, switched in _handle_update when the state flips
+        self._icons: tuple[str, str] | None = None
+        if definition.icon_on and definition.icon_off:
+            self._icons = (definition.icon_off, definition.icon_on)
+            self._attr_icon = definition.icon_off
 
     async def async_added_to_hass(self) -> None:
         """Register for updates."""
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                "night_battery_charger_update",
-                self._handle_update,
-            )
-        )
-        self._handle_update()
+        await super().async_added_to_hass()
+        # HA writes the initial state once this returns
+        self._set_state(self._value_fn(self._state))
+
+    def _set_state(self, value: bool) -> None:
+        """Store the state and the matching icon."""
+        self._attr_is_on = value
+        if self._icons is not None:
+            self._attr_icon = self._icons[1] if value else self._icons[0]
 
     @callback
     def _handle_update(self) -> None:
         """Handle state update."""
-        try:
-            self._attr_is_on = self._definition.value_fn(self._state)
-        except Exception:
-            self._attr_is_on = False
+        value = self._value_fn(self._state)
+        # Unchanged values are not written again
+        if value == self._attr_is_on:
+            return
+        self._set_state(value)
         self.async_write_ha_state()
 
 
@@ -129,10 +128,13 @@ async def async_setup_binary_sensors(
     entry: ConfigEntry,
     state: NidiaState,
     async_add_entities: AddEntitiesCallback,
+    coordinator=None,
 ) -> None:
     """Set up binary sensor entities."""
+    events = coordinator.events if coordinator else None
+    device_info = nidia_device_info(entry.entry_id)
     entities = [
-        NidiaBinarySensor(entry.entry_id, state, definition)
+        NidiaBinarySensor(entry.entry_id, state, definition, events, device_info)
         for definition in BINARY_SENSOR_DEFINITIONS
     ]
     async_add_entities(entities)
@@ -5,20 +5,22 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.components.button import ButtonEntity
-from homeassistant.helpers.entity import DeviceInfo
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from ..const import DOMAIN
 from ..nidia_logging import get_logger
+from .base import nidia_device_info
 
 
 class RecalculatePlanButton(ButtonEntity):
     """Button to manually recalculate charge plan."""
 
+    __slots__ = ("_coordinator", "_logger")
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:refresh"
 
@@ -26,6 +28,7 @@ class RecalculatePlanButton(ButtonEntity):
         self,
         entry_id: str,
         coordinator,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize."""
         self._coordinator = coordinator
@@ -34,11 +37,7 @@ class RecalculatePlanButton(ButtonEntity):
         self._attr_unique_id = f"{entry_id}_recalculate"
         self._attr_name = "Recalculate Plan"
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
+        self._attr_device_info = device_info or nidia_device_info(entry_id)
 
     async def async_press(self) -> None:
         """Handle button press."""
@@ -49,6 +48,8 @@ class RecalculatePlanButton(ButtonEntity):
 class ForceChargeButton(ButtonEntity):
     """Button to force charge to 100%."""
 
+    __slots__ = ("_coordinator", "_logger")
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:battery-charging-100"
 
@@ -56,6 +57,7 @@ class ForceChargeButton(ButtonEntity):
         self,
         entry_id: str,
         coordinator,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize."""
         self._coordinator = coordinator
@@ -64,11 +66,7 @@ class ForceChargeButton(ButtonEntity):
         self._attr_unique_id = f"{entry_id}_force_charge"
         self._attr_name = "Force Charge Tonight"
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
+        self._attr_device_info = device_info or nidia_device_info(entry_id)
 
     async def async_press(self) -> None:
         """Handle button press."""
@@ -79,6 +77,8 @@ class ForceChargeButton(ButtonEntity):
 class DisableChargeButton(ButtonEntity):
     """Button to disable charging tonight."""
 
+    __slots__ = ("_coordinator", "_logger")
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:battery-off"
 
@@ -86,6 +86,7 @@ class DisableChargeButton(ButtonEntity):
         self,
         entry_id: str,
         coordinator,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize."""
         self._coordinator = coordinator
@@ -94,11 +95,7 @@ class DisableChargeButton(ButtonEntity):
         self._attr_unique_id = f"{entry_id}_disable_charge"
         self._attr_name = "Disable Charge Tonight"
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
+        self._attr_device_info = device_info or nidia_device_info(entry_id)
 
     async def async_press(self) -> None:
         """Handle button press."""
@@ -113,8 +110,9 @@ async def async_setup_buttons(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up button entities."""
+    device_info = nidia_device_info(entry.entry_id)
     async_add_entities([
-        RecalculatePlanButton(entry.entry_id, coordinator),
-        ForceChargeButton(entry.entry_id, coordinator),
-        DisableChargeButton(entry.entry_id, coordinator),
+        RecalculatePlanButton(entry.entry_id, coordinator, device_info),
+        ForceChargeButton(entry.entry_id, coordinator, device_info),
+        DisableChargeButton(entry.entry_id, coordinator, device_info),
     ])
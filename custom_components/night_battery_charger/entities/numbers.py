@@ -7,20 +7,21 @@ from typing import TYPE_CHECKING
 from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.const import UnitOfEnergy
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from ..const import DOMAIN
+from ..domain.ev_manager import EVManager
 from ..nidia_logging import get_logger
+from .base import NidiaEntity, nidia_device_info
 
 
-class EVEnergyNumber(NumberEntity, RestoreEntity):
+class EVEnergyNumber(NidiaEntity, NumberEntity, RestoreEntity):
     """Number entity for EV energy input.
 
     This entity:
@@ -30,7 +31,8 @@ class EVEnergyNumber(NumberEntity, RestoreEntity):
     - Delegates all logic to coordinator
     """
 
-    _attr_has_entity_name = True
+    __slots__ = ("_coordinator", "_logger")
+
     _attr_native_min_value = 0.0
     _attr_native_max_value = 200.0
     _attr_native_step = 0.1
@@ -43,8 +45,10 @@ class EVEnergyNumber(NumberEntity, RestoreEntity):
         self,
         entry_id: str,
         coordinator,  # NidiaCoordinator
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize."""
+        super().__init__(entry_id, coordinator.events, device_info)
         self._coordinator = coordinator
         self._logger = get_logger()
 
@@ -52,14 +56,8 @@ class EVEnergyNumber(NumberEntity, RestoreEntity):
         self._attr_name = "EV Energy"
         self._attr_native_value = 0.0
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
-
     async def async_added_to_hass(self) -> None:
-        """Restore state and register for updates."""
+        """Register for updates and restore state."""
         await super().async_added_to_hass()
 
         self._logger.info("EV_ENTITY_ADDED_TO_HASS")
@@ -92,16 +90,6 @@ class EVEnergyNumber(NumberEntity, RestoreEntity):
             except (ValueError, TypeError) as ex:
                 self._logger.error("EV_RESTORE_ERROR", error=str(ex))
 
-        # Register for updates
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                "night_battery_charger_update",
-                self._handle_update,
-            )
-        )
-        self._logger.info("EV_DISPATCHER_CONNECTED")
-
     @callback
     def _handle_update(self) -> None:
         """Sync with coordinator state."""
@@ -137,25 +125,26 @@ class EVEnergyNumber(NumberEntity, RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra attributes."""
-        attrs = {}
-        ev_state = self._coordinator.state.ev
-
-        if ev_state.is_timer_active and ev_state.timer_start:
-            attrs["timer_start"] = ev_state.timer_start.isoformat()
-            # Calculate remaining time
-            from datetime import datetime
-            elapsed = datetime.now() - ev_state.timer_start
-            remaining_minutes = max(0, int((6 * 60) - (elapsed.total_seconds() / 60)))
-            attrs["timeout_remaining_minutes"] = remaining_minutes
+        state = self._coordinator.state
+        ev_state = state.ev
 
-        attrs["bypass_active"] = ev_state.bypass_active
+        if not (ev_state.is_timer_active and ev_state.timer_start):
+            return {"bypass_active": ev_state.bypass_active}
 
-        return attrs
+        return {
+            "timer_start": ev_state.timer_start.isoformat(),
+            "timeout_remaining_minutes": EVManager.get_remaining_timeout_minutes(
+                ev_state.timer_start, dt_util.now(), state.ev_timeout_hours
+            ),
+            "bypass_active": ev_state.bypass_active,
+        }
 
 
 class MinConsumptionNumber(NumberEntity):
     """Number entity for minimum consumption fallback."""
 
+    __slots__ = ("_coordinator",)
+
     _attr_has_entity_name = True
     _attr_native_min_value = 0.0
     _attr_native_max_value = 50.0
@@ -169,6 +158,7 @@ class MinConsumptionNumber(NumberEntity):
         self,
         entry_id: str,
         coordinator,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize."""
         self._coordinator = coordinator
@@ -177,14 +167,12 @@ class MinConsumptionNumber(NumberEntity):
         self._attr_name = "Minimum Consumption Fallback"
         self._attr_native_value = coordinator.state.minimum_consumption_fallback
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
+        self._attr_device_info = device_info or nidia_device_info(entry_id)
 
     async def async_set_native_value(self, value: float) -> None:
         """Handle value change."""
+        if value == self._attr_native_value:
+            return
         self._attr_native_value = value
         self._coordinator.state.minimum_consumption_fallback = value
         self.async_write_ha_state()
@@ -197,7 +185,8 @@ async def async_setup_numbers(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up number entities."""
+    device_info = nidia_device_info(entry.entry_id)
     async_add_entities([
-        EVEnergyNumber(entry.entry_id, coordinator),
-        MinConsumptionNumber(entry.entry_id, coordinator),
+        EVEnergyNumber(entry.entry_id, coordinator, device_info),
+        MinConsumptionNumber(entry.entry_id, coordinator, device_info),
     ])
@@ -7,6 +7,7 @@ Add a new sensor = add one line to SENSOR_DEFINITIONS.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import TYPE_CHECKING, Callable, Any
 
 from homeassistant.components.sensor import (
@@ -16,38 +17,40 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import UnitOfEnergy, PERCENTAGE
 from homeassistant.core import callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.entity import DeviceInfo
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from ..core.events import NidiaEventBus
     from ..core.state import NidiaState
 
-from ..const import DOMAIN
+from .base import NidiaEntity, nidia_device_info
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SensorDefinition:
     """Definition for a sensor entity."""
 
     key: str  # Unique identifier
     name: str  # Display name
-    value_fn: Callable[[Any], Any]  # Function to get value from state
+    # Function to get value from state, plain fields use attrgetter
+    value_fn: Callable[[Any], Any]
     unit: str | None = None
     device_class: SensorDeviceClass | None = None
     state_class: SensorStateClass | None = None
     icon: str | None = None
+    precision: int | None = None  # Round the value to this many digits
 
 
 # All sensor definitions in one place
-SENSOR_DEFINITIONS: list[SensorDefinition] = [
+SENSOR_DEFINITIONS: tuple[SensorDefinition, ...] = (
     # Energy forecasts
     SensorDefinition(
         key="load_forecast_today",
         name="Load Forecast Today",
-        value_fn=lambda s: s.current_plan.load_forecast_kwh,
+        value_fn=attrgetter("current_plan.load_forecast_kwh"),
         unit=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL,
@@ -55,7 +58,7 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="solar_forecast_today",
         name="Solar Forecast Today",
-        value_fn=lambda s: s.current_plan.solar_forecast_kwh,
+        value_fn=attrgetter("current_plan.solar_forecast_kwh"),
         unit=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL,
@@ -65,7 +68,7 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="planned_grid_charge",
         name="Planned Grid Charge",
-        value_fn=lambda s: s.current_plan.planned_charge_kwh,
+        value_fn=attrgetter("current_plan.planned_charge_kwh"),
         unit=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL,
@@ -73,7 +76,7 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="target_soc",
         name="Target SOC",
-        value_fn=lambda s: s.current_plan.target_soc_percent,
+        value_fn=attrgetter("current_plan.target_soc_percent"),
         unit=PERCENTAGE,
         device_class=SensorDeviceClass.BATTERY,
         state_class=SensorStateClass.MEASUREMENT,
@@ -89,7 +92,7 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="last_run_charged",
         name="Last Run Charged Energy",
-        value_fn=lambda s: s.last_run_charged_kwh,
+        value_fn=attrgetter("last_run_charged_kwh"),
         unit=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL,
@@ -97,7 +100,7 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="last_run_summary",
         name="Last Run Summary",
-        value_fn=lambda s: s.last_run_summary,
+        value_fn=attrgetter("last_run_summary"),
         icon="mdi:text-box-outline",
     ),
 
@@ -105,14 +108,14 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="min_soc_reserve",
         name="Min SOC Reserve",
-        value_fn=lambda s: s.min_soc_reserve_percent,
+        value_fn=attrgetter("min_soc_reserve_percent"),
         unit=PERCENTAGE,
         icon="mdi:battery-low",
     ),
     SensorDefinition(
         key="safety_spread",
         name="Safety Spread",
-        value_fn=lambda s: s.safety_spread_percent,
+        value_fn=attrgetter("safety_spread_percent"),
         unit=PERCENTAGE,
         icon="mdi:shield-check",
     ),
@@ -121,7 +124,7 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="current_day_consumption",
         name="Current Day Consumption",
-        value_fn=lambda s: s.consumption.current_day_kwh,
+        value_fn=attrgetter("consumption.current_day_kwh"),
         unit=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL,
@@ -131,7 +134,7 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="ev_energy",
         name="EV Energy Requested",
-        value_fn=lambda s: s.ev.energy_kwh,
+        value_fn=attrgetter("ev.energy_kwh"),
         unit=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         icon="mdi:ev-station",
@@ -141,7 +144,7 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="charging_window",
         name="Charging Window",
-        value_fn=lambda s: f"{s.window_start_hour:02d}:{s.window_start_minute:02d} - {s.window_end_hour:02d}:{s.window_end_minute:02d}",
+        value_fn=attrgetter("window_display"),
         icon="mdi:clock-time-four-outline",
     ),
 
@@ -150,7 +153,8 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="total_savings",
         name="Total Savings",
-        value_fn=lambda s: round(s.savings.total_savings_eur, 2),
+        value_fn=attrgetter("savings.total_savings_eur"),
+        precision=2,
         unit="EUR",
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
@@ -159,7 +163,8 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="monthly_savings",
         name="Monthly Savings",
-        value_fn=lambda s: round(s.savings.monthly_savings_eur, 2),
+        value_fn=attrgetter("savings.monthly_savings_eur"),
+        precision=2,
         unit="EUR",
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
@@ -168,7 +173,8 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="lifetime_savings",
         name="Lifetime Savings",
-        value_fn=lambda s: round(s.savings.lifetime_savings_eur, 2),
+        value_fn=attrgetter("savings.lifetime_savings_eur"),
+        precision=2,
         unit="EUR",
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
@@ -177,7 +183,8 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="total_charged_kwh",
         name="Total Energy Charged",
-        value_fn=lambda s: round(s.savings.total_charged_kwh, 2),
+        value_fn=attrgetter("savings.total_charged_kwh"),
+        precision=2,
         unit=UnitOfEnergy.KILO_WATT_HOUR,
         device_class=SensorDeviceClass.ENERGY,
         state_class=SensorStateClass.TOTAL_INCREASING,
@@ -188,57 +195,59 @@ SENSOR_DEFINITIONS: list[SensorDefinition] = [
     SensorDefinition(
         key="price_peak",
         name="Peak Price",
-        value_fn=lambda s: s.pricing.price_peak,
+        value_fn=attrgetter("pricing.price_peak"),
         unit="EUR/kWh",
         icon="mdi:currency-eur",
     ),
     SensorDefinition(
         key="price_offpeak",
         name="Off-Peak Price",
-        value_fn=lambda s: s.pricing.price_offpeak,
+        value_fn=attrgetter("pricing.price_offpeak"),
         unit="EUR/kWh",
         icon="mdi:currency-eur",
     ),
-]
+)
 
-# Add weekday average sensors
+# Weekday average sensors, built when the platform is set up
 # Note: These are computed averages, not cumulative totals, so we don't use
 # device_class=ENERGY (which requires state_class=TOTAL or TOTAL_INCREASING)
 WEEKDAY_NAMES = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
 WEEKDAY_DISPLAY = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
 
-for i, (key, display) in enumerate(zip(WEEKDAY_NAMES, WEEKDAY_DISPLAY)):
-    SENSOR_DEFINITIONS.append(
+
+def weekday_sensor_definitions() -> tuple[SensorDefinition, ...]:
+    """Build the average consumption definitions, one per weekday."""
+    return tuple(
         SensorDefinition(
             key=f"avg_consumption_{key}",
             name=f"Average Consumption {display}",
-            value_fn=lambda s, idx=i: (
-                s.consumption.history
-                and sum(e["consumption_kwh"] for e in s.consumption.history if e["weekday"] == idx)
-                / max(1, sum(1 for e in s.consumption.history if e["weekday"] == idx))
-                or 0.0
-            ),
+            value_fn=lambda s, idx=i: s.consumption.weekday_averages[idx],
             unit=UnitOfEnergy.KILO_WATT_HOUR,
             icon="mdi:chart-bar",
         )
+        for i, (key, display) in enumerate(zip(WEEKDAY_NAMES, WEEKDAY_DISPLAY))
     )
 
 
-class NidiaSensor(SensorEntity):
+class NidiaSensor(NidiaEntity, SensorEntity):
     """Generic Nidia sensor entity."""
 
-    _attr_has_entity_name = True
-    _attr_should_poll = False
+    __slots__ = ("_state", "_definition", "_value_fn", "_precision")
 
     def __init__(
         self,
         entry_id: str,
         state: NidiaState,
         definition: SensorDefinition,
+        events: NidiaEventBus | None = None,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         """Initialize the sensor."""
+        super().__init__(entry_id, events, device_info)
         self._state = state
         self._definition = definition
+        self._value_fn = definition.value_fn
+        self._precision = definition.precision
 
         self._attr_unique_id = f"{entry_id}_{definition.key}"
         self._attr_name = definition.name
@@ -248,66 +257,62 @@ class NidiaSensor(SensorEntity):
         if definition.icon:
             self._attr_icon = definition.icon
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
-
     async def async_added_to_hass(self) -> None:
         """Register for updates."""
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                "night_battery_charger_update",
-                self._handle_update,
-            )
-        )
-        self._handle_update()
+        await super().async_added_to_hass()
+        # HA writes the initial state once this returns
+        self._attr_native_value = self._read_value()
+
+    def _read_value(self) -> Any:
+        """Read the current value from NidiaState."""
+        value = self._value_fn(self._state)
+        if self._precision is not None:
+            value = round(value, self._precision)
+        return value
 
     @callback
     def _handle_update(self) -> None:
         """Handle state update."""
-        try:
-            self._attr_native_value = self._definition.value_fn(self._state)
-        except (ValueError, TypeError, AttributeError, KeyError):
-            # Specific exceptions for data access issues
-            self._attr_native_value = None
+        value = self._read_value()
+        # Unchanged values are not written again
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
         self.async_write_ha_state()
 
 
-class ConsumptionTrackingSensor(SensorEntity):
+class ConsumptionTrackingSensor(NidiaEntity, SensorEntity):
     """Specialized sensor for consumption tracking with detailed attributes."""
 
-    _attr_has_entity_name = True
-    _attr_should_poll = False
+    __slots__ = ("_coordinator", "_attrs_cache", "_attrs_version")
+
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_state_class = SensorStateClass.TOTAL
     _attr_icon = "mdi:home-lightning-bolt"
 
-    def __init__(self, entry_id: str, coordinator) -> None:
+    def __init__(
+        self,
+        entry_id: str,
+        coordinator,
+        device_info: DeviceInfo | None = None,
+    ) -> None:
         """Initialize the sensor."""
+        super().__init__(entry_id, coordinator.events, device_info)
         self._coordinator = coordinator
 
         self._attr_unique_id = f"{entry_id}_consumption_tracking"
         self._attr_name = "Consumption Tracking"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
+
+        # Attributes built for this event bus version
+        self._attrs_cache: dict | None = None
+        self._attrs_version = -1
 
     async def async_added_to_hass(self) -> None:
         """Register for updates."""
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                "night_battery_charger_update",
-                self._handle_update,
-            )
-        )
-        self._handle_update()
+        await super().async_added_to_hass()
+        # HA writes the initial state once this returns
+        self._attr_native_value = self._coordinator.forecaster.current_day_consumption
 
     @callback
     def _handle_update(self) -> None:
@@ -317,19 +322,27 @@ class ConsumptionTrackingSensor(SensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict:
-        """Return detailed tracking attributes."""
+        """Return detailed tracking attributes.
+
+        Rebuilt only after the event bus refreshed the entities again.
+        """
+        version = self._events.version
+        if self._attrs_cache is not None and self._attrs_version == version:
+            return self._attrs_cache
+
         forecaster = self._coordinator.forecaster
 
         attrs = {
             "current_day_kwh": round(forecaster.current_day_consumption, 3),
             "history_days": forecaster.history_count,
-            "tracking_active": forecaster._last_reading_time is not None,
+            "tracking_active": forecaster.tracking_active,
         }
 
         # Last reading info
-        if forecaster._last_reading_time:
-            attrs["last_reading_time"] = forecaster._last_reading_time.isoformat()
-            attrs["last_reading_watts"] = round(forecaster._last_reading_value or 0, 1)
+        last_reading_time = forecaster.last_reading_time
+        if last_reading_time:
+            attrs["last_reading_time"] = last_reading_time.isoformat()
+            attrs["last_reading_watts"] = round(forecaster.last_reading_value or 0, 1)
 
         # Weekday averages
         weekday_avgs = forecaster.get_all_weekday_averages()
@@ -337,12 +350,13 @@ class ConsumptionTrackingSensor(SensorEntity):
             attrs[f"avg_{day}"] = round(avg, 2)
 
         # Recent history (last 7 days)
-        recent = sorted(forecaster.history, key=lambda x: x["date"], reverse=True)[:7]
         attrs["recent_history"] = [
             {"date": r["date"], "kwh": round(r["consumption_kwh"], 2)}
-            for r in recent
+            for r in forecaster.recent_history(7)
         ]
 
+        self._attrs_cache = attrs
+        self._attrs_version = version
         return attrs
 
 
@@ -354,13 +368,17 @@ async def async_setup_sensors(
     coordinator=None,
 ) -> None:
     """Set up all sensor entities."""
+    events = coordinator.events if coordinator else None
+    device_info = nidia_device_info(entry.entry_id)
     entities = [
-        NidiaSensor(entry.entry_id, state, definition)
-        for definition in SENSOR_DEFINITIONS
+        NidiaSensor(entry.entry_id, state, definition, events, device_info)
+        for definition in SENSOR_DEFINITIONS + weekday_sensor_definitions()
     ]
 
     # Add specialized consumption tracking sensor if coordinator is provided
     if coordinator:
-        entities.append(ConsumptionTrackingSensor(entry.entry_id, coordinator))
+        entities.append(
+            ConsumptionTrackingSensor(entry.entry_id, coordinator, device_info)
+        )
 
     async_add_entities(entities)
@@ -5,25 +5,33 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from homeassistant.components.switch import SwitchEntity
-from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.entity import EntityCategory
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from ..const import DOMAIN
 from ..nidia_logging import get_logger
+from .base import nidia_device_info
 
 
 class IgnoreEVSwitch(SwitchEntity):
     """Switch to ignore EV energy in charge calculations."""
 
+    __slots__ = ("_coordinator", "_logger")
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:car-off"
     _attr_translation_key = "ignore_ev"
 
-    def __init__(self, entry_id: str, coordinator) -> None:
+    def __init__(
+        self,
+        entry_id: str,
+        coordinator,
+        device_info: DeviceInfo | None = None,
+    ) -> None:
         """Initialize."""
         self._coordinator = coordinator
         self._logger = get_logger()
@@ -31,11 +39,7 @@ class IgnoreEVSwitch(SwitchEntity):
         self._attr_unique_id = f"{entry_id}_ignore_ev"
         self._attr_is_on = coordinator.state.ignore_ev_in_calculations
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
+        self._attr_device_info = device_info or nidia_device_info(entry_id)
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn on - ignore EV in calculations, bypass always ON."""
@@ -44,7 +48,6 @@ class IgnoreEVSwitch(SwitchEntity):
         self._logger.info("IGNORE_EV_ENABLED")
         # Activate bypass (always on when ignoring EV)
         await self._coordinator.hardware.set_bypass(True)
-        self._coordinator.state.ev.bypass_active = True
         # Recalculate plan without EV
         await self._coordinator.recalculate_plan(for_preview=True)
         self.async_write_ha_state()
@@ -57,7 +60,6 @@ class IgnoreEVSwitch(SwitchEntity):
         # Deactivate bypass (will be controlled by EV logic)
         if self._coordinator.state.ev.energy_kwh == 0:
             await self._coordinator.hardware.set_bypass(False)
-            self._coordinator.state.ev.bypass_active = False
         # Recalculate plan with EV
         await self._coordinator.recalculate_plan(for_preview=True)
         self.async_write_ha_state()
@@ -66,12 +68,19 @@ class IgnoreEVSwitch(SwitchEntity):
 class DebugLoggingSwitch(SwitchEntity):
     """Switch to control debug file logging."""
 
+    __slots__ = ("_logger", "_hass", "_cached_log_size_kb", "_cached_available_dates")
+
     _attr_has_entity_name = True
     _attr_icon = "mdi:bug"
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_translation_key = "debug_logging"
 
-    def __init__(self, entry_id: str, hass: HomeAssistant) -> None:
+    def __init__(
+        self,
+        entry_id: str,
+        hass: HomeAssistant,
+        device_info: DeviceInfo | None = None,
+    ) -> None:
         """Initialize."""
         self._logger = get_logger()
         self._hass = hass
@@ -83,11 +92,7 @@ class DebugLoggingSwitch(SwitchEntity):
         self._cached_log_size_kb: float = 0.0
         self._cached_available_dates: int = 0
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry_id)},
-            name="Nidia Smart Battery Recharge",
-            manufacturer="Nidia",
-        )
+        self._attr_device_info = device_info or nidia_device_info(entry_id)
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -139,7 +144,8 @@ async def async_setup_switches(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up switch entities."""
+    device_info = nidia_device_info(entry.entry_id)
     async_add_entities([
-        IgnoreEVSwitch(entry.entry_id, coordinator),
-        DebugLoggingSwitch(entry.entry_id, hass),
+        IgnoreEVSwitch(entry.entry_id, coordinator, device_info),
+        DebugLoggingSwitch(entry.entry_id, hass, device_info),
     ])
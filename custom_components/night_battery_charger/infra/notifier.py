@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ..core.state import NidiaState, ChargePlan, ChargeSession
     from ..core.hardware import HardwareController
+    from ..domain.planner import EnergyBalance
 
 
 class Notifier:
@@ -88,7 +89,7 @@ class Notifier:
         old_plan: ChargePlan,
         new_plan: ChargePlan,
         bypass_activated: bool,
-        energy_balance: dict,
+        energy_balance: EnergyBalance,
     ) -> bool:
         """Send notification when EV energy changes.
 
@@ -97,7 +98,7 @@ class Notifier:
             old_plan: Previous plan
             new_plan: New plan
             bypass_activated: Whether bypass was activated
-            energy_balance: Energy balance dict
+            energy_balance: Energy balance from ChargePlanner
 
         Returns:
             True if sent successfully
@@ -105,8 +106,8 @@ class Notifier:
         if not self.state.notify_on_update:
             return False
 
-        available = energy_balance.get("available", 0)
-        needed = energy_balance.get("needed", 0)
+        available = energy_balance.available
+        needed = energy_balance.needed
         deficit = needed - available
 
         if bypass_activated:
@@ -19,12 +19,21 @@ import logging
 import queue
 import threading
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# NidiaLogger level names -> stdlib levels (unknown names log at DEBUG)
+_LEVELS = {
+    "critical": logging.CRITICAL,
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+}
+
 
 class NidiaLogger:
     """Unified logger that always works.
@@ -79,6 +88,12 @@ class NidiaLogger:
         self._file_handler: RotatingFileHandler | None = None
         self._file_handler_initialized = False
 
+        # Records for the rotating file go through a queue so that formatting,
+        # disk writes and rollover happen on the listener thread
+        self._record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler: QueueHandler | None = None
+        self._listener: QueueListener | None = None
+
         # Background thread for file I/O
         self._write_queue: queue.Queue = queue.Queue()
         self._shutdown_event = threading.Event()
@@ -126,35 +141,45 @@ class NidiaLogger:
         # Initialize file handler in this thread (blocking I/O is OK here)
         self._init_file_handler_sync()
 
-        while not self._shutdown_event.is_set():
+        stop = False
+        while not stop and not self._shutdown_event.is_set():
             try:
                 # Wait for work with timeout to check shutdown
                 item = self._write_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
 
+            if item is None:
+                # Sentinel received, exit
+                break
+
+            # Drain whatever else is already queued so a burst of events
+            # is written with one open() per daily file
+            batch = [item]
+            while True:
+                try:
+                    item = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
                 if item is None:
-                    # Sentinel received, exit
+                    stop = True
                     break
+                batch.append(item)
 
-                action, args = item
-                if action == "daily_log":
-                    self._write_to_daily_log_sync(*args)
-                elif action == "rotating_log":
-                    # Already handled by RotatingFileHandler
-                    pass
-
-                self._write_queue.task_done()
-
-            except queue.Empty:
-                continue
+            try:
+                # Only daily log entries go through this queue, the rotating
+                # file is written by the QueueListener
+                self._write_daily_batch_sync(
+                    [args for action, args in batch if action == "daily_log"]
+                )
             except Exception as ex:
                 _LOGGER.error("Error in log writer thread: %s", ex)
 
+            for _ in batch:
+                self._write_queue.task_done()
+
         # Cleanup
-        if self._file_handler:
-            try:
-                self._file_handler.close()
-            except Exception:
-                pass
+        self.close()
 
     def _init_file_handler_sync(self) -> None:
         """Initialize file handler (runs in background thread)."""
@@ -175,13 +200,38 @@ class NidiaLogger:
             self._file_handler.setFormatter(formatter)
             self._file_handler.setLevel(logging.DEBUG)
 
-            # Attach to our logger
-            self._ha_logger.addHandler(self._file_handler)
+            # Only the queue handler is attached to our logger, the rotating
+            # file is written by the listener thread
+            self._listener = QueueListener(self._record_queue, self._file_handler)
+            self._listener.start()
+            self._queue_handler = QueueHandler(self._record_queue)
+            self._ha_logger.addHandler(self._queue_handler)
             self._file_handler_initialized = True
 
         except Exception as ex:
             _LOGGER.error("Failed to set up file handler: %s", ex)
 
+    def close(self) -> None:
+        """Detach and stop the rotating file handler, flushing queued records."""
+        if self._queue_handler is not None:
+            self._ha_logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+
+        if self._listener is not None:
+            try:
+                self._listener.stop()
+            except Exception:
+                pass
+            self._listener = None
+
+        if self._file_handler is not None:
+            try:
+                self._file_handler.close()
+            except Exception:
+                pass
+            self._file_handler = None
+            self._file_handler_initialized = False
+
     def _get_daily_log_file(self, dt: datetime | None = None) -> Path:
         """Get path to daily structured log file."""
         if dt is None:
@@ -191,23 +241,42 @@ class NidiaLogger:
         daily_dir.mkdir(parents=True, exist_ok=True)
         return daily_dir / "events.log"
 
-    def _write_to_daily_log_sync(self, event: str, level: str, data: dict, timestamp: datetime) -> None:
-        """Write structured event to daily log file (runs in background thread)."""
-        try:
-            log_file = self._get_daily_log_file(timestamp)
+    def _write_daily_batch_sync(
+        self, entries: list[tuple[str, str, dict, datetime]]
+    ) -> None:
+        """Write structured events to the daily log files (runs in background thread).
 
+        Entries are grouped by day so each file is opened once per batch.
+        An entry that cannot be serialized is logged and skipped.
+        """
+        lines_by_day: dict[tuple[int, int, int], list[str]] = {}
+        first_of_day: dict[tuple[int, int, int], datetime] = {}
+        for event, level, data, timestamp in entries:
+            day = (timestamp.year, timestamp.month, timestamp.day)
             entry = {
                 "timestamp": timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
                 "level": level,
                 "event": event,
                 "data": data,
             }
+            try:
+                line = json.dumps(entry, default=str) + "\n"
+            except Exception as ex:
+                _LOGGER.error("Failed to serialize daily log entry %s: %s", event, ex)
+                continue
+            lines = lines_by_day.get(day)
+            if lines is None:
+                lines = lines_by_day[day] = []
+                first_of_day[day] = timestamp
+            lines.append(line)
 
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, default=str) + "\n")
-
-        except Exception as ex:
-            _LOGGER.error("Failed to write to daily log: %s", ex)
+        for day, lines in lines_by_day.items():
+            try:
+                log_file = self._get_daily_log_file(first_of_day[day])
+                with open(log_file, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            except Exception as ex:
+                _LOGGER.error("Failed to write to daily log: %s", ex)
 
     def _queue_daily_log(self, event: str, level: str, data: dict) -> None:
         """Queue a daily log write (non-blocking)."""
@@ -228,48 +297,60 @@ class NidiaLogger:
             event: Event name (e.g., "EV_SET_START", "PLAN_CALCULATED")
             **data: Additional context data
         """
-        message = f"{event}"
-        if data:
-            data_str = " | ".join(f"{k}={v}" for k, v in data.items())
-            message = f"{event} | {data_str}"
-
-        # Always write to HA logs for important levels
-        if level == self.CRITICAL:
-            self._ha_logger.critical(message)
-        elif level == self.ERROR:
-            self._ha_logger.error(message)
-        elif level == self.WARNING:
-            self._ha_logger.warning(message)
-        elif level == self.INFO:
-            self._ha_logger.info(message)
-        else:  # DEBUG
-            self._ha_logger.debug(message)
+        self._log(level, event, data)
+
+    def _log(self, level: str, event: str, data: dict[str, Any]) -> None:
+        """Log an event with an already built data dict.
+
+        The level helpers forward their kwargs dict here directly instead of
+        re-expanding it through log(**data), which would copy it again.
+        """
+        # Write to HA logs (and the rotating file) - only format the
+        # message when the record would not be filtered out anyway
+        level_int = _LEVELS.get(level, logging.DEBUG)
+        if self._ha_logger.isEnabledFor(level_int):
+            if data:
+                data_str = " | ".join([f"{k}={v}" for k, v in data.items()])
+                message = f"{event} | {data_str}"
+            else:
+                message = event
+            self._ha_logger.log(level_int, message)
 
         # Queue write to daily structured log (non-blocking)
         self._queue_daily_log(event, level, data)
 
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 - mirrors logging.Logger
+        """Check whether a record at the given stdlib level would be emitted.
+
+        Lets callers skip building kwargs for hot-path log calls. The daily
+        structured log accepts every level while file logging is enabled.
+        """
+        return self._file_logging_enabled or self._ha_logger.isEnabledFor(level)
+
     def critical(self, event: str, **data: Any) -> None:
         """Log critical event - ALWAYS visible in HA logs."""
-        self.log(self.CRITICAL, event, **data)
+        self._log(self.CRITICAL, event, data)
 
     def error(self, event: str, **data: Any) -> None:
         """Log error event."""
-        self.log(self.ERROR, event, **data)
+        self._log(self.ERROR, event, data)
 
     def warning(self, event: str, **data: Any) -> None:
         """Log warning event."""
-        self.log(self.WARNING, event, **data)
+        self._log(self.WARNING, event, data)
 
     def info(self, event: str, **data: Any) -> None:
         """Log info event - visible in HA logs."""
-        self.log(self.INFO, event, **data)
+        self._log(self.INFO, event, data)
 
     def debug(self, event: str, **data: Any) -> None:
         """Log debug event - only in file logs by default."""
-        self.log(self.DEBUG, event, **data)
+        self._log(self.DEBUG, event, data)
 
     def separator(self, title: str = "") -> None:
         """Log a visual separator."""
+        if not self.isEnabledFor(logging.DEBUG):
+            return
         if title:
             sep = f"{'=' * 20} {title} {'=' * 20}"
         else:
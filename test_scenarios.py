@@ -263,11 +263,11 @@ balance1 = ChargePlanner.calculate_energy_balance(
     ev_energy_kwh=2.0,
 )
 print(f"  Balance 1: battery=5, solar=4, consumption=6, ev=2")
-print(f"    Available: {balance1['available']} kWh")
-print(f"    Needed (with margin): {balance1['needed_with_margin']:.2f} kWh")
-print(f"    Sufficient: {balance1['sufficient']}")
-assert balance1['available'] == 9.0
-assert balance1['sufficient'] == False
+print(f"    Available: {balance1.available} kWh")
+print(f"    Needed (with margin): {balance1.needed_with_margin:.2f} kWh")
+print(f"    Sufficient: {balance1.sufficient}")
+assert balance1.available == 9.0
+assert balance1.sufficient == False
 print("    ✓ PASS")
 
 # Test with definitely sufficient
@@ -278,10 +278,10 @@ balance2 = ChargePlanner.calculate_energy_balance(
     ev_energy_kwh=2.0,
 )
 print(f"  Balance 2: battery=8, solar=5, consumption=6, ev=2")
-print(f"    Available: {balance2['available']} kWh")
-print(f"    Needed (with margin): {balance2['needed_with_margin']:.2f} kWh")
-print(f"    Sufficient: {balance2['sufficient']}")
-assert balance2['sufficient'] == True
+print(f"    Available: {balance2.available} kWh")
+print(f"    Needed (with margin): {balance2.needed_with_margin:.2f} kWh")
+print(f"    Sufficient: {balance2.sufficient}")
+assert balance2.sufficient == True
 print("    ✓ PASS")
 
 # ============================================================
@@ -672,15 +672,16 @@ for _ in range(100):
     avg = forecaster_cached.get_weekday_average(3)  # Thursday
 elapsed_first = time_module.time() - start
 
-# Invalidate cache and test again
-forecaster_cached._invalidate_cache()  # Private method, for testing only
+# Rebuild the running sums and test again
+forecaster_cached._rebuild_weekday_sums()  # Private method, for testing only
 start = time_module.time()
 for _ in range(100):
     avg2 = forecaster_cached.get_weekday_average(3)
 elapsed_second = time_module.time() - start
+assert abs(avg - avg2) < 1e-9, "Running sums must match a full rebuild"
 
 print(f"    100 cached lookups: {elapsed_first*1000:.2f}ms")
-print(f"    100 post-invalidation lookups: {elapsed_second*1000:.2f}ms")
+print(f"    100 post-rebuild lookups: {elapsed_second*1000:.2f}ms")
 print(f"    Average value: {avg:.2f} kWh")
 print("    ✓ PASS")
 
@@ -18,6 +18,13 @@ from custom_components.night_battery_charger.const import (
     CONF_SAFETY_SPREAD,
     CONF_NOTIFY_SERVICE,
 )
+from custom_components.night_battery_charger.nidia_logging import get_logger
+
+
+@pytest.fixture(autouse=True, scope="session")
+def nidia_logger():
+    """Start the logger writer thread before the per-test thread leak check."""
+    return get_logger()
 
 
 @pytest.fixture(autouse=True)
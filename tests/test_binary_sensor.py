@@ -27,3 +27,30 @@ async def test_charging_active_initial_state(hass: HomeAssistant, setup_integrat
     """Test charging active initial state."""
     state = hass.states.get("binary_sensor.night_charge_active")
     assert state.state in ["on", "off"]
+
+
+def test_binary_sensor_icon_follows_state():
+    """Definitions with on/off icons switch the icon with the state."""
+    from unittest.mock import MagicMock
+
+    from custom_components.night_battery_charger.core.state import NidiaState
+    from custom_components.night_battery_charger.entities.binary_sensors import (
+        BINARY_SENSOR_DEFINITIONS,
+        NidiaBinarySensor,
+    )
+
+    state = NidiaState()
+    definitions = {d.key: d for d in BINARY_SENSOR_DEFINITIONS}
+    bypass = NidiaBinarySensor("entry", state, definitions["is_bypass_active"])
+    scheduled = NidiaBinarySensor("entry", state, definitions["is_charging_scheduled"])
+    bypass.async_write_ha_state = MagicMock()
+    scheduled.async_write_ha_state = MagicMock()
+
+    assert bypass.icon == "mdi:electric-switch"
+    state.ev.bypass_active = True
+    bypass._handle_update()
+    assert bypass.is_on
+    assert bypass.icon == "mdi:electric-switch-closed"
+
+    scheduled._handle_update()
+    assert scheduled.icon is None
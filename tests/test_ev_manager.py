@@ -0,0 +1,51 @@
+"""Test the pure EV management logic."""
+from datetime import datetime, time, timedelta
+
+from custom_components.night_battery_charger.domain.ev_manager import (
+    EVManager,
+    EVSetResult,
+)
+
+
+def test_timeout_and_remaining_minutes():
+    """Timeout helpers agree on the elapsed time against the configured limit."""
+    start = datetime(2025, 1, 1, 0, 30)
+
+    now = start + timedelta(hours=2, minutes=30)
+    assert not EVManager.is_timeout_reached(start, now, timeout_hours=3.0)
+    assert EVManager.get_remaining_timeout_minutes(start, now, timeout_hours=3.0) == 30
+
+    now = start + timedelta(hours=3)
+    assert EVManager.is_timeout_reached(start, now, timeout_hours=3.0)
+    assert EVManager.get_remaining_timeout_minutes(start, now, timeout_hours=3.0) == 0
+
+    assert not EVManager.is_timeout_reached(None, now)
+    assert EVManager.get_remaining_timeout_minutes(None, now) == 0
+
+
+def test_evaluate_clamps_and_checks_window():
+    """Out-of-range values are clamped and the window decides the result."""
+    now = datetime(2025, 1, 1, 2, 0)
+
+    def evaluate(value, current):
+        return EVManager.evaluate(
+            new_value=value,
+            old_value=0.0,
+            current_time=current,
+            now=now,
+            timer_start=None,
+            energy_balance={},
+        )
+
+    decision = evaluate(250.0, time(2, 0))
+    assert decision.result is EVSetResult.PROCESSED
+    assert decision.value == 200.0
+    assert decision.bypass_should_activate
+
+    assert evaluate(float("nan"), time(2, 0)).result is EVSetResult.RESET
+    assert evaluate(-5.0, time(2, 0)).result is EVSetResult.RESET
+
+    # Outside the window a zero is only saved, not treated as a reset
+    decision = evaluate(0.0, time(12, 0))
+    assert decision.result is EVSetResult.SAVED
+    assert decision.value == 0.0
@@ -0,0 +1,156 @@
+"""Test the Nidia event bus."""
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.night_battery_charger.core.events import (
+    EventData,
+    NidiaEvent,
+    NidiaEventBus,
+)
+
+
+@pytest.fixture
+def bus():
+    """Create an event bus with a mocked hass."""
+    return NidiaEventBus(MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_handlers_receive_event_data(bus):
+    """Registered handlers get an EventData with the emitted payload."""
+    received: list[EventData] = []
+
+    async def handler(event_data):
+        received.append(event_data)
+
+    bus.on(NidiaEvent.EV_ENERGY_SET, handler)
+    await bus.emit(NidiaEvent.EV_ENERGY_SET, energy_kwh=5.0)
+    await bus.emit(NidiaEvent.EV_ENERGY_RESET)
+
+    assert len(received) == 1
+    assert received[0].event is NidiaEvent.EV_ENERGY_SET
+    assert received[0].data == {"energy_kwh": 5.0}
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_and_off(bus):
+    """Unsubscribing removes one registration and drops empty entries."""
+    calls = []
+
+    async def first(event_data):
+        calls.append("first")
+
+    async def second(event_data):
+        calls.append("second")
+
+    unsub = bus.on(NidiaEvent.MIDNIGHT, first)
+    bus.on(NidiaEvent.MIDNIGHT, second)
+
+    unsub()
+    await bus.emit(NidiaEvent.MIDNIGHT)
+    assert calls == ["second"]
+
+    bus.off(NidiaEvent.MIDNIGHT, second)
+    bus.off(NidiaEvent.MIDNIGHT, second)
+    assert NidiaEvent.MIDNIGHT not in bus._handlers
+
+
+@pytest.mark.asyncio
+async def test_handler_error_does_not_stop_others(bus):
+    """A failing handler is logged and the remaining handlers still run."""
+    calls = []
+
+    async def broken(event_data):
+        raise RuntimeError("boom")
+
+    async def working(event_data):
+        calls.append(event_data.event)
+
+    bus.on(NidiaEvent.TARGET_REACHED, broken)
+    bus.on(NidiaEvent.TARGET_REACHED, working)
+    await bus.emit(NidiaEvent.TARGET_REACHED, soc=90.0)
+
+    assert calls == [NidiaEvent.TARGET_REACHED]
+
+
+@pytest.mark.asyncio
+async def test_emit_many_dispatches_once(bus):
+    """A batch with several UI events refreshes entities a single time."""
+    calls = []
+
+    async def handler(event_data):
+        calls.append(event_data.data)
+
+    bus.on(NidiaEvent.PLAN_UPDATED, handler)
+    listener = MagicMock()
+    bus.async_add_listener(listener)
+
+    await bus.emit_many([
+        (NidiaEvent.PLAN_UPDATED, {"target_soc": 80.0}),
+        (NidiaEvent.EV_ENERGY_SET, {"energy_kwh": 5.0}),
+        (NidiaEvent.UI_UPDATE, {}),
+    ])
+    bus.hass.loop.call_later.assert_called_once()
+    _, flush = bus.hass.loop.call_later.call_args.args
+    flush()
+
+    assert calls == [{"target_soc": 80.0}]
+    listener.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_dispatch_requests_coalesced(bus):
+    """Refreshes requested before the debounce fires share one dispatch."""
+    listener = MagicMock()
+    remove = bus.async_add_listener(listener)
+
+    await bus.emit(NidiaEvent.PLAN_UPDATED)
+    await bus.emit_state_update()
+    bus.request_dispatch()
+    bus.hass.loop.call_later.assert_called_once()
+
+    _, flush = bus.hass.loop.call_later.call_args.args
+    flush()
+    listener.assert_called_once()
+
+    # After the flush a new request schedules again
+    bus.request_dispatch()
+    assert bus.hass.loop.call_later.call_count == 2
+
+    bus.cancel_dispatch()
+    bus.hass.loop.call_later.return_value.cancel.assert_called_once()
+    assert bus._pending_dispatch is None
+
+    # Removed listeners are no longer called
+    remove()
+    bus.async_update_listeners()
+    listener.assert_called_once()
+
+
+def test_listener_error_does_not_stop_others(bus):
+    """A failing entity callback is logged and later entities still refresh."""
+    broken = MagicMock(side_effect=RuntimeError("boom"))
+    working = MagicMock()
+    bus.async_add_listener(broken)
+    bus.async_add_listener(working)
+
+    bus.async_update_listeners()
+
+    broken.assert_called_once()
+    working.assert_called_once()
+
+
+def test_has_handlers(bus):
+    """Dispatch events always count, others only with a registered handler."""
+    async def handler(event_data):
+        pass
+
+    assert bus.has_handlers(NidiaEvent.PLAN_UPDATED)
+    assert not bus.has_handlers(NidiaEvent.EV_TIMEOUT)
+
+    unsub = bus.on(NidiaEvent.EV_TIMEOUT, handler)
+    assert bus.has_handlers(NidiaEvent.EV_TIMEOUT)
+
+    unsub()
+    assert not bus.has_handlers(NidiaEvent.EV_TIMEOUT)
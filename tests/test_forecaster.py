@@ -0,0 +1,116 @@
+"""Test the consumption forecaster."""
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.night_battery_charger.domain.forecaster import (
+    ConsumptionForecaster,
+)
+
+
+def test_weekday_averages_single_pass():
+    """Averages are grouped per weekday, missing days default to 0.0."""
+    forecaster = ConsumptionForecaster(history=[
+        {"date": "2025-01-06", "weekday": 0, "consumption_kwh": 10.0},
+        {"date": "2025-01-13", "weekday": 0, "consumption_kwh": 14.0},
+        {"date": "2025-01-11", "weekday": 5, "consumption_kwh": 8.0},
+    ])
+
+    assert forecaster.get_weekday_average(0) == 12.0
+    assert forecaster.get_weekday_average(1) == 0.0
+    assert forecaster.get_all_weekday_averages()["saturday"] == 8.0
+
+    # Monday forecast, below-minimum averages fall back to the minimum
+    now = datetime(2025, 1, 20, 12, 0)
+    assert forecaster.get_consumption_forecast(now=now, minimum_fallback=5.0) == 12.0
+    assert forecaster.get_consumption_forecast(
+        for_tomorrow=True, now=now, minimum_fallback=5.0
+    ) == 5.0
+
+    forecaster.delete_record("2025-01-13")
+    assert forecaster.get_weekday_average(0) == 10.0
+
+
+def test_close_day_updates_running_sums():
+    """Closing days keeps the running sums equal to a full rebuild."""
+    forecaster = ConsumptionForecaster()
+    start = datetime(2025, 1, 1)
+    for day in range(30):
+        forecaster.add_power_reading(1000.0, start + timedelta(days=day))
+        forecaster.add_power_reading(
+            1000.0 + day * 10, start + timedelta(days=day, minutes=30)
+        )
+        forecaster.close_day(start + timedelta(days=day + 1))
+
+    assert forecaster.history_count == 21
+    averages = forecaster.get_all_weekday_averages()
+
+    forecaster._rebuild_weekday_sums()
+    assert forecaster.get_all_weekday_averages() == pytest.approx(averages)
+
+
+def test_power_integration_accepts_epoch_seconds():
+    """Datetime and epoch timestamps integrate the same way."""
+    start = datetime(2025, 1, 1, 10, 0)
+    by_datetime = ConsumptionForecaster()
+    by_epoch = ConsumptionForecaster()
+    assert not by_datetime.tracking_active
+
+    for minutes, watts in ((0, 1000.0), (30, 2000.0), (90, 500.0)):
+        now = start + timedelta(minutes=minutes)
+        by_datetime.add_power_reading(watts, now)
+        by_epoch.add_power_reading(watts, now.timestamp())
+
+    # 30 min at 1.5 kW average, then 60 min at 1.25 kW
+    assert by_datetime.current_day_consumption == pytest.approx(2.0)
+    assert by_epoch.current_day_consumption == pytest.approx(2.0)
+    assert by_datetime.tracking_active
+    assert by_datetime.last_reading_time.timestamp() == (
+        start + timedelta(minutes=90)
+    ).timestamp()
+
+    # Gaps over an hour only restart the integration
+    by_datetime.add_power_reading(3000.0, start + timedelta(hours=4))
+    assert by_datetime.current_day_consumption == pytest.approx(2.0)
+
+
+def test_last_reading_time_uses_ha_timezone():
+    """The last reading is reported in HA's time zone, not the host's."""
+    default_tz = dt_util.DEFAULT_TIME_ZONE
+    dt_util.set_default_time_zone(dt_util.get_time_zone("America/New_York"))
+    try:
+        now = dt_util.now()
+        forecaster = ConsumptionForecaster()
+        forecaster.add_power_reading(1000.0, now)
+
+        last = forecaster.last_reading_time
+        assert last == now
+        assert last.utcoffset() == now.utcoffset()
+        assert last.tzinfo is dt_util.DEFAULT_TIME_ZONE
+    finally:
+        dt_util.set_default_time_zone(default_tz)
+
+
+def test_close_day_without_readings_skips_history():
+    """A day with no power readings is not recorded as a zero day."""
+    forecaster = ConsumptionForecaster(history=[
+        {"date": "2025-01-06", "weekday": 0, "consumption_kwh": 10.0},
+    ])
+
+    record = forecaster.close_day(datetime(2025, 1, 14))
+    assert record.date == "2025-01-13"
+    assert record.consumption_kwh == 0.0
+    assert forecaster.history_count == 1
+    assert forecaster.get_weekday_average(0) == 10.0
+
+
+def test_recent_history_newest_first():
+    """Recent records come from the tail of the date-ordered history."""
+    forecaster = ConsumptionForecaster(history=[
+        {"date": f"2025-01-{day:02d}", "weekday": 0, "consumption_kwh": float(day)}
+        for day in (5, 1, 9, 3)
+    ])
+
+    assert [r["date"] for r in forecaster.recent_history(2)] == ["2025-01-09", "2025-01-05"]
+    assert len(forecaster.recent_history()) == 4
@@ -0,0 +1,100 @@
+"""Test the HardwareController."""
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import State
+
+from custom_components.night_battery_charger.core.hardware import HardwareController
+from custom_components.night_battery_charger.core.state import NidiaState
+
+
+@pytest.fixture
+def states():
+    """Entity states served by the mocked hass."""
+    return {}
+
+
+@pytest.fixture
+def controller(states):
+    """Create a hardware controller with a mocked hass."""
+    hass = MagicMock()
+    hass.states.get.side_effect = states.get
+    state = NidiaState(soc_sensor_entity="sensor.battery_soc")
+    return HardwareController(hass, state, MagicMock())
+
+
+def test_sensor_value_cached_until_state_changes(controller, states):
+    """Unchanged states reuse the parsed value, new states are re-read."""
+    states["sensor.battery_soc"] = first = State("sensor.battery_soc", "50.0")
+    assert controller.get_battery_soc() == 50.0
+    assert controller._sensor_cache["sensor.battery_soc"] == (first.last_updated, 50.0)
+
+    # Same state object: served from the cache
+    assert controller.get_battery_soc() == 50.0
+
+    states["sensor.battery_soc"] = State("sensor.battery_soc", "63.5")
+    assert controller.get_battery_soc() == 63.5
+    assert controller.state.current_soc == 63.5
+
+
+def test_sensor_value_unavailable_not_cached(controller, states):
+    """Unavailable states fall back to the default and are not cached."""
+    states["sensor.battery_soc"] = State("sensor.battery_soc", "unavailable")
+    assert controller.get_sensor_value("sensor.battery_soc", default=7.0) == 7.0
+    assert "sensor.battery_soc" not in controller._sensor_cache
+
+
+@pytest.mark.asyncio
+async def test_send_notification_uses_parsed_service(controller):
+    """The notify service is split once into domain and service."""
+    controller.hass.services.async_call = AsyncMock()
+    controller.events = MagicMock(emit=AsyncMock())
+    controller.state.notify_service = "notify.mobile_app"
+
+    assert await controller.send_notification("hello")
+    controller.hass.services.async_call.assert_awaited_once_with(
+        "notify", "mobile_app", {"message": "hello"}
+    )
+
+    controller.state.notify_service = "mobile_app"
+    assert not await controller.send_notification("hello")
+
+
+@pytest.mark.asyncio
+async def test_bypass_state_lives_in_nidia_state(controller, states):
+    """Bypass state is tracked only in state.ev.bypass_active."""
+    controller.hass.services.async_call = AsyncMock()
+    controller.events = MagicMock(emit=AsyncMock())
+    controller.state.bypass_switch_entity = "switch.bypass"
+
+    assert await controller.set_bypass(True)
+    assert controller.state.ev.bypass_active
+    assert controller.is_bypass_on
+
+    # Already on: no service call
+    assert await controller.set_bypass(True)
+    controller.hass.services.async_call.assert_awaited_once()
+
+    # EV reset keeps the flag until the switch is actually turned off
+    controller.state.ev.reset()
+    assert controller.state.ev.bypass_active
+
+    states["switch.bypass"] = State("switch.bypass", "off")
+    controller.sync_hardware_state()
+    assert not controller.state.ev.bypass_active
+
+
+def test_sync_hardware_state(controller, states):
+    """Bypass and inverter flags follow the actual switch states."""
+    controller.state.bypass_switch_entity = "switch.bypass"
+    controller.state.inverter_switch_entity = "switch.inverter"
+    states["switch.bypass"] = State("switch.bypass", "on")
+    states["switch.inverter"] = State("switch.inverter", "unavailable")
+
+    controller.sync_hardware_state()
+    assert controller.is_bypass_on
+    assert not controller.is_inverter_on
+
+    states["switch.inverter"] = State("switch.inverter", "on")
+    controller.sync_hardware_state()
+    assert controller.is_inverter_on
@@ -0,0 +1,47 @@
+"""Test the charge planner."""
+import pytest
+
+from custom_components.night_battery_charger.domain.planner import (
+    ChargePlanner,
+    PlanningInput,
+)
+
+
+def _input(**overrides):
+    """Build a planning input with 10 kWh battery defaults."""
+    data = {
+        "current_soc_percent": 30.0,
+        "battery_capacity_kwh": 10.0,
+        "min_soc_reserve_percent": 15.0,
+        "safety_spread_percent": 10.0,
+        "consumption_forecast_kwh": 8.0,
+        "solar_forecast_kwh": 4.0,
+    }
+    data.update(overrides)
+    return PlanningInput(**data)
+
+
+def test_calculate_plan_and_reasoning():
+    """Target includes reserve, net load and safety spread."""
+    result = ChargePlanner.calculate(_input(ev_energy_kwh=2.0))
+
+    # (1.5 reserve + 6 net load) * 1.1 = 8.25 kWh -> 82.5%
+    assert result.target_soc_percent == pytest.approx(82.5)
+    assert result.planned_charge_kwh == pytest.approx(5.25)
+    assert result.is_charging_scheduled
+    assert result.reasoning == (
+        "Planned 5.25 kWh grid charge. Today's estimated load is 8.00 kWh"
+        " + 2.00 kWh EV, with 4.00 kWh solar forecast. Target SOC: 82.5%."
+    )
+
+    preview = ChargePlanner.calculate(_input(is_preview=True, disable_charge=True))
+    assert preview.planned_charge_kwh == 0.0
+    assert preview.reasoning.startswith("[DISABLED BY USER] Planned 0.00 kWh")
+    assert "Tomorrow's estimated load is 8.00 kWh, with" in preview.reasoning
+
+
+def test_calculate_memoized_per_input():
+    """Equal inputs reuse the cached result, any change recalculates."""
+    first = ChargePlanner.calculate(_input())
+    assert ChargePlanner.calculate(_input()) is first
+    assert ChargePlanner.calculate(_input(current_soc_percent=31.0)) is not first
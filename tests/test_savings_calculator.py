@@ -0,0 +1,88 @@
+"""Test the savings calculator."""
+from datetime import date, timedelta
+
+import pytest
+
+from custom_components.night_battery_charger.domain.savings_calculator import (
+    SavingsCalculator,
+)
+
+
+def test_history_savings_aggregates():
+    """Savings over the kept history are summed and averaged per day."""
+    calc = SavingsCalculator(price_peak=0.30, price_offpeak=0.10)
+    today = date.today()
+    calc.record_charge_session(5.0, charge_date=today)
+    calc.record_charge_session(2.5, charge_date=today)
+
+    assert calc.get_last_30_days_savings() == pytest.approx(1.5)
+    assert calc.get_average_daily_savings() == 1.5
+
+    calc.record_charge_session(1.0, charge_date=today - timedelta(days=1))
+    assert calc.state.history_days == 2
+    assert calc.get_average_daily_savings() == 0.85
+
+    assert SavingsCalculator().get_average_daily_savings() == 0.0
+
+
+def test_history_pruned_to_last_30_days():
+    """Records older than 30 days are dropped when a new session is recorded."""
+    calc = SavingsCalculator()
+    today = date.today()
+    for days_ago in (45, 31, 30, 3):
+        calc.record_charge_session(1.0, charge_date=today - timedelta(days=days_ago))
+
+    assert [h["date"] for h in calc.state.history] == [
+        (today - timedelta(days=30)).isoformat(),
+        (today - timedelta(days=3)).isoformat(),
+    ]
+    # Totals keep every recorded session
+    assert calc.state.lifetime_charged_kwh == 4.0
+
+
+def test_rates_follow_price_updates():
+    """Night/day rates are refreshed when prices or the mode change."""
+    calc = SavingsCalculator(price_peak=0.30, price_offpeak=0.10)
+    assert (calc.get_night_rate(), calc.get_day_rate()) == (0.10, 0.30)
+
+    calc.update_prices(price_f1=0.32, price_f2=0.16, price_f3=0.08, pricing_mode="three_tier")
+    assert calc.get_night_rate() == 0.08
+    assert calc.get_day_rate() == pytest.approx((11 * 0.32 + 5 * 0.16) / 16)
+
+
+def test_history_days_survive_reload():
+    """Restored state counts its history dates, pruning updates the count."""
+    today = date.today()
+    calc = SavingsCalculator.from_dict({
+        "state": {
+            "history": [
+                {"date": (today - timedelta(days=40)).isoformat(), "savings": 1.0},
+                {"date": (today - timedelta(days=2)).isoformat(), "savings": 1.0},
+                {"date": (today - timedelta(days=2)).isoformat(), "savings": 0.5},
+            ],
+        },
+    })
+    assert calc.state.history_days == 2
+
+    calc.record_charge_session(1.0, charge_date=today)
+    assert calc.state.history_days == 2
+    assert len(calc.state.history) == 3
+
+
+def test_monthly_stats_reset_on_month_rollover():
+    """Monthly totals restart with a new month, the stored month round-trips."""
+    calc = SavingsCalculator.from_dict({
+        "state": {"current_month": "2025-01", "monthly_charged_kwh": 4.0},
+    })
+    assert calc.state.current_year_month == (2025, 1)
+
+    calc.record_charge_session(1.0, charge_date=date(2025, 1, 31))
+    assert calc.state.monthly_charged_kwh == 5.0
+
+    calc.record_charge_session(2.0, charge_date=date(2025, 2, 1))
+    assert calc.state.monthly_charged_kwh == 2.0
+    assert calc.get_savings_summary()["current_month"] == "2025-02"
+
+    restored = SavingsCalculator.from_dict(calc.to_dict())
+    assert restored.state.current_year_month == (2025, 2)
+    assert SavingsCalculator().state.current_month == ""
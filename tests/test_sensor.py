@@ -1,8 +1,48 @@
 """Test sensor entities."""
+from datetime import datetime
+from unittest.mock import MagicMock
+
 import pytest
 from homeassistant.core import HomeAssistant
 
 from custom_components.night_battery_charger.const import DOMAIN
+from custom_components.night_battery_charger.core.events import NidiaEventBus
+from custom_components.night_battery_charger.core.state import NidiaState
+from custom_components.night_battery_charger.domain.forecaster import (
+    ConsumptionForecaster,
+)
+from custom_components.night_battery_charger.entities.sensors import (
+    SENSOR_DEFINITIONS,
+    ConsumptionTrackingSensor,
+    NidiaSensor,
+    SensorDefinition,
+    async_setup_sensors,
+)
+
+
+@pytest.fixture
+def bus():
+    """Create an event bus with a mocked hass."""
+    return NidiaEventBus(MagicMock())
+
+
+@pytest.fixture
+def state():
+    """Create a default NidiaState."""
+    return NidiaState()
+
+
+@pytest.fixture
+def soc_sensor(state, bus):
+    """Create a SOC sensor on the bus with state writes mocked."""
+    sensor = NidiaSensor(
+        "entry",
+        state,
+        SensorDefinition(key="soc", name="SOC", value_fn=lambda s: s.current_soc),
+        bus,
+    )
+    sensor.async_write_ha_state = MagicMock()
+    return sensor
 
 
 @pytest.mark.asyncio
@@ -75,3 +115,73 @@ async def test_sensor_device_info(hass: HomeAssistant, setup_integration):
     assert state is not None
     # Device info is set in the entity, not in state attributes
     # This is validated by the entity creation itself
+
+
+def test_sensor_skips_unchanged_writes(state, soc_sensor):
+    """Only actual value changes write the state."""
+    soc_sensor._handle_update()
+    soc_sensor._handle_update()
+    assert soc_sensor.async_write_ha_state.call_count == 1
+
+    state.current_soc = 42.0
+    soc_sensor._handle_update()
+    assert soc_sensor.native_value == 42.0
+    assert soc_sensor.async_write_ha_state.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_sensor_refreshed_by_bus_listener(state, bus, soc_sensor):
+    """Added sensors register one listener on the event bus."""
+    soc_sensor.hass = MagicMock()
+
+    # The initial value is only read, HA writes it after the add
+    state.current_soc = 20.0
+    await soc_sensor.async_added_to_hass()
+    assert len(bus._update_listeners) == 1
+    assert soc_sensor.native_value == 20.0
+    soc_sensor.async_write_ha_state.assert_not_called()
+
+    state.current_soc = 55.0
+    bus.async_update_listeners()
+    assert soc_sensor.native_value == 55.0
+    soc_sensor.async_write_ha_state.assert_called_once()
+
+
+def test_sensor_precision_rounds_value(state):
+    """Definitions with a precision publish the rounded value."""
+    state.savings.total_savings_eur = 12.3456
+    definition = next(d for d in SENSOR_DEFINITIONS if d.key == "total_savings")
+    sensor = NidiaSensor("entry", state, definition)
+    sensor.async_write_ha_state = MagicMock()
+
+    sensor._handle_update()
+    assert sensor.native_value == 12.35
+
+
+def test_consumption_tracking_attributes_cached_per_version(bus):
+    """Attributes are rebuilt only after the next entity refresh."""
+    coordinator = MagicMock(events=bus, forecaster=ConsumptionForecaster())
+    sensor = ConsumptionTrackingSensor("entry", coordinator)
+
+    attrs = sensor.extra_state_attributes
+    assert sensor.extra_state_attributes is attrs
+    assert attrs["history_days"] == 0
+
+    coordinator.forecaster.add_power_reading(500.0, datetime(2025, 1, 2, 1, 0))
+    bus.async_update_listeners()
+    assert sensor.extra_state_attributes["tracking_active"]
+
+
+@pytest.mark.asyncio
+async def test_setup_shares_device_info_per_entry():
+    """Sensors of one setup share a DeviceInfo, a new setup builds its own."""
+    entry = MagicMock(entry_id="entry")
+    first, second = MagicMock(), MagicMock()
+    await async_setup_sensors(MagicMock(), entry, NidiaState(), first)
+    await async_setup_sensors(MagicMock(), entry, NidiaState(), second)
+
+    sensors = first.call_args.args[0]
+    device_info = sensors[0].device_info
+    assert all(sensor.device_info is device_info for sensor in sensors)
+    assert second.call_args.args[0][0].device_info is not device_info
+    assert second.call_args.args[0][0].device_info == device_info
@@ -1,4 +1,6 @@
 """Test service handlers."""
+import asyncio
+
 import pytest
 from homeassistant.core import HomeAssistant
 
@@ -40,3 +42,69 @@ async def test_service_disable_tonight(hass: HomeAssistant, setup_integration):
         DOMAIN, "disable_tonight", {}, blocking=True
     )
     await hass.async_block_till_done()
+
+
+@pytest.mark.asyncio
+async def test_overlapping_recalculations_wait_for_plan(
+    hass: HomeAssistant, setup_integration
+):
+    """Calls during a recalculation are coalesced and wait for its result."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    runs = []
+    release = asyncio.Event()
+    real_recalculate = coordinator._recalculate_plan
+
+    async def slow_recalculate(batch, for_preview=True):
+        runs.append(for_preview)
+        await release.wait()
+        await real_recalculate(batch, for_preview)
+
+    coordinator._recalculate_plan = slow_recalculate
+
+    first = hass.async_create_task(coordinator.recalculate_plan(for_preview=True))
+    await asyncio.sleep(0)
+    second = hass.async_create_task(coordinator.recalculate_plan(for_preview=False))
+    third = hass.async_create_task(coordinator.recalculate_plan(for_preview=False))
+    await asyncio.sleep(0)
+
+    # The later callers wait for the running recalculation
+    assert not second.done()
+    release.set()
+    await asyncio.gather(first, second, third)
+
+    # One more run covers both later calls
+    assert runs == [True, False]
+    assert coordinator._recalc_done is None
+
+
+@pytest.mark.asyncio
+async def test_preview_request_does_not_replace_tonight_plan(
+    hass: HomeAssistant, setup_integration
+):
+    """A preview call joining a non-preview one keeps the tonight plan."""
+    coordinator = hass.data[DOMAIN][setup_integration.entry_id]
+    runs = []
+    release = asyncio.Event()
+    real_recalculate = coordinator._recalculate_plan
+
+    async def slow_recalculate(batch, for_preview=True):
+        runs.append(for_preview)
+        await release.wait()
+        await real_recalculate(batch, for_preview)
+
+    coordinator._recalculate_plan = slow_recalculate
+
+    first = hass.async_create_task(coordinator.recalculate_plan(for_preview=True))
+    await asyncio.sleep(0)
+    tonight = hass.async_create_task(coordinator.recalculate_plan(for_preview=False))
+    preview = hass.async_create_task(coordinator.recalculate_plan(for_preview=True))
+    await asyncio.sleep(0)
+
+    # Record which plan was published last when the non-preview caller returns
+    seen = []
+    tonight.add_done_callback(lambda _: seen.append(runs[-1]))
+    release.set()
+    await asyncio.gather(first, tonight, preview)
+
+    assert runs == [True, False]
+    assert seen == [False]
@@ -0,0 +1,97 @@
+"""Test the NidiaState container."""
+from datetime import datetime, time
+
+from custom_components.night_battery_charger.core.state import (
+    ConsumptionState,
+    NidiaState,
+    OverrideMode,
+)
+from custom_components.night_battery_charger.domain.forecaster import (
+    ConsumptionForecaster,
+)
+
+
+def test_force_and_disable_are_exclusive():
+    """Enabling one override clears the other, disabling only clears itself."""
+    state = NidiaState()
+    assert state.override_mode is OverrideMode.NONE
+
+    state.force_charge_enabled = True
+    assert state.force_charge_enabled
+    assert not state.disable_charge_enabled
+
+    state.disable_charge_enabled = True
+    assert state.override_mode is OverrideMode.DISABLE
+    assert not state.force_charge_enabled
+
+    # Turning off force must not clear an active disable
+    state.force_charge_enabled = False
+    assert state.disable_charge_enabled
+
+    state.reset_overrides()
+    assert state.override_mode is OverrideMode.NONE
+
+
+def test_to_dict_serializes_nested_state():
+    """to_dict exports scalars, nested objects and ISO timestamps."""
+    state = NidiaState(window_start_hour=1, window_start_minute=30)
+    state.ev.energy_kwh = 12.5
+    state.ev.timer_start = datetime(2025, 1, 1, 0, 30)
+    state.current_plan.reasoning = "x" * 150
+
+    data = state.to_dict()
+
+    assert data["battery_capacity_kwh"] == 10.0
+    assert data["window_start"] == "01:30"
+    assert data["ev"] == {
+        "energy_kwh": 12.5,
+        "timer_start": "2025-01-01T00:30:00",
+        "bypass_active": False,
+        "is_timer_active": True,
+    }
+    assert len(data["current_plan"]["reasoning"]) == 100
+    assert data["current_session"]["start_time"] is None
+
+
+def test_update_sets_known_fields_only():
+    """update() assigns public fields and settable properties, ignores others."""
+    state = NidiaState()
+    state.update(current_soc=55.0, force_charge_enabled=True, bogus=1, _logger=None)
+
+    assert state.current_soc == 55.0
+    assert state.override_mode is OverrideMode.FORCE
+    assert not hasattr(state, "bogus")
+    assert state._logger is not None
+
+
+def test_window_times_refreshed_on_update():
+    """Window time objects are built up front and rebuilt by update()."""
+    state = NidiaState(window_start_hour=1, window_start_minute=30)
+    start = state.window_start_time
+
+    assert start == time(1, 30)
+    assert state.window_start_time is start
+    assert state.window_end_time == time(7, 0)
+
+    assert state.window_display == "01:30 - 07:00"
+
+    state.update(window_end_hour=6)
+    assert state.window_end_time == time(6, 0)
+    assert state.window_display == "01:30 - 06:00"
+
+
+def test_set_history_uses_forecaster_averages():
+    """Weekday averages are taken over from the forecaster's running sums."""
+    consumption = ConsumptionState()
+    history = [
+        {"date": "2025-01-06", "weekday": 0, "consumption_kwh": 10.0},
+        {"date": "2025-01-08", "weekday": 2, "consumption_kwh": 9.5},
+        {"date": "2025-01-13", "weekday": 0, "consumption_kwh": 14.0},
+    ]
+    forecaster = ConsumptionForecaster(history=history)
+    consumption.set_history(forecaster.history, forecaster.weekday_averages)
+
+    assert consumption.history == history
+    assert consumption.history is not history
+    assert consumption.history is not forecaster.history
+    assert consumption.weekday_averages == [12.0, 0.0, 9.5, 0.0, 0.0, 0.0, 0.0]